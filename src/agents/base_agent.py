@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from src.llm.bedrock_client import BedrockConverseClient
 
 
-@dataclass
+@dataclass(slots=True)
 class BaseAgent:
     name: str
     llm: BedrockConverseClient
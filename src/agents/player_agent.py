@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
+
+import orjson
 
 from src.agents.base_agent import BaseAgent
 from src.game.models import Character
@@ -26,18 +28,32 @@ INTERESTS_BRIEF = (
 )
 
 
-def _load_strategy_brief() -> str:
-    strategy_path = Path(__file__).resolve().parents[2] / "STRATEGY.md"
+_TAKE_TOKEN_RE = re.compile(
+    r"\b(?:i|we)\s+(?:will\s+)?(?:take|grab|pick)\s+(?:vote\s+)?token\s*([1-4])\b",
+    re.IGNORECASE,
+)
+
+_STRATEGY_PATH = Path(__file__).resolve().parents[2] / "STRATEGY.md"
+_STRATEGY_CACHE: dict[str, tuple[float, int, str]] = {}
+
+
+def _strategy_brief() -> str:
+    strategy_path = _STRATEGY_PATH
     try:
-        text = strategy_path.read_text(encoding="utf-8").strip()
+        st = strategy_path.stat()
     except OSError:
         return ""
-    if not text:
+    key = str(strategy_path)
+    cached = _STRATEGY_CACHE.get(key)
+    if cached is not None and cached[0] == st.st_mtime and cached[1] == st.st_size:
+        return cached[2]
+    try:
+        text = strategy_path.read_text(encoding="utf-8").strip()
+    except OSError:
         return ""
-    return f"\n\nStrategic guidance:\n{text}"
-
-
-STRATEGY_BRIEF = _load_strategy_brief()
+    brief = f"\n\nStrategic guidance:\n{text}" if text else ""
+    _STRATEGY_CACHE[key] = (st.st_mtime, st.st_size, brief)
+    return brief
 
 
 NEGOTIATION_TOOLS: list[dict[str, Any]] = [
@@ -184,18 +200,84 @@ VOTE_CHANGE_TOOLS: list[dict[str, Any]] = [
 ]
 
 
-@dataclass
+def _sanitize_text(text: str) -> str:
+    # split() already drops leading/trailing whitespace, so no separate strip() pass.
+    return " ".join(text.split())[:500] if text else ""
+
+
+def _as_text(value: Any) -> str:
+    return _sanitize_text("" if value is None else str(value))
+
+
+def _as_int(value: Any) -> int | None:
+    return int(value) if isinstance(value, int) else None
+
+
+def _as_vote_index(value: Any) -> int | None:
+    return int(value) if isinstance(value, int) and value in (0, 1) else None
+
+
+# Per-tool payload parsing: (result field, payload key, parser).
+_TOOL_SCHEMAS: dict[str, tuple[tuple[str, str, Callable[[Any], Any]], ...]] = {
+    "say_public": (("utterance", "message", _as_text),),
+    "take_vote_token": (("utterance", "message", _as_text), ("attempt_take_token", "token", _as_int)),
+    "cast_vote": (("utterance", "message", _as_text), ("vote", "proposal_index", _as_vote_index)),
+    "use_target_token": (("utterance", "message", _as_text), ("new_vote", "new_vote", _as_vote_index)),
+    "force_with_three_tokens": (("utterance", "message", _as_text), ("new_vote", "new_vote", _as_vote_index)),
+    "no_action": (("_control_reason", "reason", _as_text),),
+}
+
+
+# Per-phase action spec: (tool set, accepted tool names, result defaults).
+_PHASE_SPECS: dict[str, tuple[list[dict[str, Any]], tuple[str, ...], dict[str, Any]]] = {
+    "negotiation": (
+        NEGOTIATION_TOOLS,
+        ("say_public", "take_vote_token"),
+        {"utterance": "", "attempt_take_token": None},
+    ),
+    "voting": (
+        VOTING_TOOLS,
+        ("cast_vote",),
+        {"utterance": "", "vote": 0},
+    ),
+    "vote_change": (
+        VOTE_CHANGE_TOOLS,
+        ("use_target_token", "force_with_three_tokens"),
+        {"utterance": "", "action": "none", "new_vote": None},
+    ),
+}
+
+
+@dataclass(slots=True)
 class PlayerAgent(BaseAgent):
     character: Character
     negotiation_word_cap: int = 500
     use_strategy_doc: bool = True
+    include_raw: bool = False
+    _system_prompt_str: str = field(init=False, repr=False, default="")
 
-    async def negotiation_action(self, state: dict[str, Any], transcript_tail: list[str], scratchpad: str) -> dict[str, Any]:
-        system_prompt = self._system_prompt()
-        legal_tokens = self._legal_negotiation_tokens(state)
+    def __post_init__(self) -> None:
+        strategy_block = _strategy_brief() if self.use_strategy_doc else ""
+        self._system_prompt_str = (
+            "You are a game-playing AI in Rat Scramble. "
+            f"{CHARACTER_PERSONAS[self.character]} "
+            "Use tools for actions. Keep messages concise and strategic. "
+            "The referee can override actions that violate binding contracts."
+            f"\n\n{INTERESTS_BRIEF}"
+            f"{strategy_block}"
+        )
+
+    async def negotiation_action(
+        self,
+        state: dict[str, Any],
+        transcript_tail: str,
+        scratchpad: str,
+        token_mask: int | None = None,
+    ) -> dict[str, Any]:
+        legal_tokens = self._legal_negotiation_tokens(state, token_mask)
         user_prompt = f"""
 Current public state:
-{state}
+{self._state_json(state)}
 
 Recent public transcript:
 {transcript_tail}
@@ -214,74 +296,21 @@ Rules reminders:
 - If no legal vote token is available, do not call take_vote_token.
 - Use the optional private_note field in your tool input for private planning memory; private_note is never public.
 """.strip()
-        result = await self.llm.converse_with_tools(
-            system_prompt,
-            user_prompt,
-            tools=NEGOTIATION_TOOLS,
-            tool_choice="any",
-        )
-
-        tool = self._first_tool_call(result.tool_calls)
-        if tool is None:
-            utterance = self._sanitize_text(result.text)
-            data = {
-                "utterance": utterance,
-                "attempt_take_token": None,
-                "scratchpad": scratchpad,
-                "_parse_warning": "no_tool_call_returned",
-                "_control_action": "fallback_text",
-            }
-        else:
-            name = tool["name"]
-            payload = tool["input"] if isinstance(tool["input"], dict) else {}
-            private_note = self._extract_private_note(payload)
-            if name == "take_vote_token":
-                token = payload.get("token")
-                attempt = int(token) if isinstance(token, int) else None
-                utterance = self._sanitize_text(str(payload.get("message", "")))
-                data = {
-                    "utterance": utterance,
-                    "attempt_take_token": attempt,
-                    "scratchpad": self._next_scratchpad(scratchpad, private_note),
-                    "_control_action": "take_vote_token",
-                }
-            elif name == "say_public":
-                utterance = self._sanitize_text(str(payload.get("message", "")))
-                inferred_attempt = self._infer_explicit_take_token(utterance)
-                data = {
-                    "utterance": utterance,
-                    "attempt_take_token": inferred_attempt,
-                    "scratchpad": self._next_scratchpad(scratchpad, private_note),
-                    "_control_action": "say_public",
-                }
-            else:
-                reason = self._sanitize_text(str(payload.get("reason", "")))
-                data = {
-                    "utterance": "",
-                    "attempt_take_token": None,
-                    "scratchpad": self._next_scratchpad(scratchpad, private_note),
-                    "_control_action": "no_action",
-                    "_control_reason": reason,
-                }
-
-        data["_prompt"] = {"system": system_prompt, "user": user_prompt, "tools": NEGOTIATION_TOOLS}
-        data["_raw_text"] = result.text
-        data["_raw_response"] = result.raw_response
-        data["_attempts"] = result.attempts
-        data["_tool_calls"] = result.tool_calls
+        data = await self._act("negotiation", user_prompt, scratchpad)
+        if data["_control_action"] == "say_public":
+            data["attempt_take_token"] = self._infer_explicit_take_token(data["utterance"])
         return data
 
     async def voting_action(
         self,
         state: dict[str, Any],
-        transcript_tail: list[str],
+        transcript_tail: str,
         scratchpad: str,
         token_number: int,
     ) -> dict[str, Any]:
-        system_prompt = self._system_prompt()
         user_prompt = f"""
 Current public state:
-{state}
+{self._state_json(state)}
 
 Recent public transcript:
 {transcript_tail}
@@ -293,64 +322,21 @@ You hold vote token {token_number}. Voting order is 1,2,3,4.
 Use exactly one tool call now.
 Use the optional private_note field in your tool input for private planning memory; private_note is never public.
 """.strip()
-        result = await self.llm.converse_with_tools(
-            system_prompt,
-            user_prompt,
-            tools=VOTING_TOOLS,
-            tool_choice="any",
-        )
-
-        tool = self._first_tool_call(result.tool_calls)
-        if tool is None:
-            utterance = self._sanitize_text(result.text)
-            data = {
-                "utterance": utterance,
-                "vote": 0,
-                "scratchpad": scratchpad,
-                "_parse_warning": "no_tool_call_returned",
-                "_control_action": "fallback_text",
-            }
-        else:
-            payload = tool["input"] if isinstance(tool["input"], dict) else {}
-            private_note = self._extract_private_note(payload)
-            if tool["name"] == "cast_vote":
-                proposal = payload.get("proposal_index")
-                vote = int(proposal) if isinstance(proposal, int) and proposal in (0, 1) else 0
-                utterance = self._sanitize_text(str(payload.get("message", "")))
-                data = {
-                    "utterance": utterance,
-                    "vote": vote,
-                    "scratchpad": self._next_scratchpad(scratchpad, private_note),
-                    "_control_action": "cast_vote",
-                }
-            else:
-                reason = self._sanitize_text(str(payload.get("reason", "")))
-                data = {
-                    "utterance": "",
-                    "vote": 0,
-                    "scratchpad": self._next_scratchpad(scratchpad, private_note),
-                    "_control_action": "no_action",
-                    "_control_reason": reason,
-                }
-
-        data["_prompt"] = {"system": system_prompt, "user": user_prompt, "tools": VOTING_TOOLS}
-        data["_raw_text"] = result.text
-        data["_raw_response"] = result.raw_response
-        data["_attempts"] = result.attempts
-        data["_tool_calls"] = result.tool_calls
+        data = await self._act("voting", user_prompt, scratchpad)
+        if data["vote"] is None:
+            data["vote"] = 0
         return data
 
     async def vote_change_action(
         self,
         state: dict[str, Any],
-        transcript_tail: list[str],
+        transcript_tail: str,
         scratchpad: str,
         target_player: Character,
     ) -> dict[str, Any]:
-        system_prompt = self._system_prompt()
         user_prompt = f"""
 Current public state:
-{state}
+{self._state_json(state)}
 
 Recent public transcript:
 {transcript_tail}
@@ -362,111 +348,95 @@ A vote-change window is open for target voter: {target_player.value}.
 Use exactly one tool call now.
 Use the optional private_note field in your tool input for private planning memory; private_note is never public.
 """.strip()
+        data = await self._act("vote_change", user_prompt, scratchpad)
+        if data["_control_action"] in ("use_target_token", "force_with_three_tokens"):
+            data["action"] = data["_control_action"]
+        return data
+
+    async def _act(self, phase: str, user_prompt: str, scratchpad: str) -> dict[str, Any]:
+        tools, allowed_tools, defaults = _PHASE_SPECS[phase]
+        system_prompt = self._system_prompt()
         result = await self.llm.converse_with_tools(
             system_prompt,
             user_prompt,
-            tools=VOTE_CHANGE_TOOLS,
+            tools=tools,
             tool_choice="any",
         )
 
         tool = self._first_tool_call(result.tool_calls)
         if tool is None:
-            utterance = self._sanitize_text(result.text)
             data = {
-                "utterance": utterance,
-                "action": "none",
-                "new_vote": None,
+                **defaults,
+                "utterance": self._sanitize_text(result.text),
                 "scratchpad": scratchpad,
                 "_parse_warning": "no_tool_call_returned",
                 "_control_action": "fallback_text",
             }
         else:
-            payload = tool["input"] if isinstance(tool["input"], dict) else {}
-            private_note = self._extract_private_note(payload)
-            if tool["name"] in {"use_target_token", "force_with_three_tokens"}:
-                new_vote = payload.get("new_vote")
-                vote = int(new_vote) if isinstance(new_vote, int) and new_vote in (0, 1) else None
-                utterance = self._sanitize_text(str(payload.get("message", "")))
-                data = {
-                    "utterance": utterance,
-                    "action": tool["name"],
-                    "new_vote": vote,
-                    "scratchpad": self._next_scratchpad(scratchpad, private_note),
-                    "_control_action": tool["name"],
-                }
-            else:
-                reason = self._sanitize_text(str(payload.get("reason", "")))
-                data = {
-                    "utterance": "",
-                    "action": "none",
-                    "new_vote": None,
-                    "scratchpad": self._next_scratchpad(scratchpad, private_note),
-                    "_control_action": "no_action",
-                    "_control_reason": reason,
-                }
+            name = tool.get("name")
+            name = name if name in allowed_tools else "no_action"
+            payload = tool.get("input")
+            payload = payload if isinstance(payload, dict) else {}
+            data = {
+                **defaults,
+                **self._parse_tool_payload(name, payload),
+                "scratchpad": self._next_scratchpad(scratchpad, self._extract_private_note(payload)),
+                "_control_action": name,
+            }
 
-        data["_prompt"] = {"system": system_prompt, "user": user_prompt, "tools": VOTE_CHANGE_TOOLS}
+        data["_prompt"] = {"system": system_prompt, "user": user_prompt, "tools": tools}
         data["_raw_text"] = result.text
-        data["_raw_response"] = result.raw_response
+        data["_usage"] = result.raw_response.get("usage") if isinstance(result.raw_response, dict) else None
+        if self.include_raw:
+            data["_raw_response"] = result.raw_response
         data["_attempts"] = result.attempts
         data["_tool_calls"] = result.tool_calls
         return data
 
     def _system_prompt(self) -> str:
-        strategy_block = STRATEGY_BRIEF if self.use_strategy_doc else ""
-        return (
-            "You are a game-playing AI in Rat Scramble. "
-            f"{CHARACTER_PERSONAS[self.character]} "
-            "Use tools for actions. Keep messages concise and strategic. "
-            "The referee can override actions that violate binding contracts."
-            f"\n\n{INTERESTS_BRIEF}"
-            f"{strategy_block}"
-        )
+        return self._system_prompt_str
+
+    def _state_json(self, state: dict[str, Any]) -> str:
+        # Sorted keys keep the prompt byte-stable for identical states.
+        return orjson.dumps(state, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS).decode("utf-8")
 
     def _sanitize_text(self, text: str) -> str:
-        return " ".join((text or "").strip().split())[:500]
+        return _sanitize_text(text)
+
+    def _parse_tool_payload(self, tool_name: str, payload: dict[str, Any]) -> dict[str, Any]:
+        return {field_name: parse(payload.get(key)) for field_name, key, parse in _TOOL_SCHEMAS[tool_name]}
 
     def _extract_private_note(self, payload: dict[str, Any]) -> str:
         return self._sanitize_text(str(payload.get("private_note", "")))
 
     def _first_tool_call(self, tool_calls: list[dict[str, Any]]) -> dict[str, Any] | None:
-        if not tool_calls:
-            return None
-        call = tool_calls[0]
-        name = str(call.get("name", "")).strip()
-        payload = call.get("input", {})
-        return {"name": name, "input": payload}
+        return tool_calls[0] if tool_calls else None
 
     def _infer_explicit_take_token(self, utterance: str) -> int | None:
-        match = re.search(r"\b(?:i|we)\s+(?:will\s+)?(?:take|grab|pick)\s+(?:vote\s+)?token\s*([1-4])\b", utterance, re.IGNORECASE)
-        if match:
-            return int(match.group(1))
-        return None
+        match = _TAKE_TOKEN_RE.search(utterance)
+        return int(match.group(1)) if match else None
 
-    def _legal_negotiation_tokens(self, state: dict[str, Any]) -> list[int]:
+    def _legal_negotiation_tokens(self, state: dict[str, Any], token_mask: int | None = None) -> list[int]:
         assignments_raw = state.get("token_assignments", {})
         if not isinstance(assignments_raw, dict):
             return []
-
-        assigned_tokens: set[int] = set()
-        assigned_players: set[str] = set()
-        for token_raw, player_raw in assignments_raw.items():
-            try:
-                assigned_tokens.add(int(token_raw))
-            except Exception:
-                continue
-            if isinstance(player_raw, str):
-                assigned_players.add(player_raw)
-
-        if self.character.value in assigned_players:
+        if self.character.value in assignments_raw.values():
             return []
-        if 3 not in assigned_tokens:
+
+        if token_mask is None:
+            token_mask = 0
+            for token in assignments_raw:
+                token_mask |= 1 << token
+
+        if not token_mask & (1 << 3):
             return [3]
-        return [token for token in (4, 2, 1) if token not in assigned_tokens]
+        return [token for token in (4, 2, 1) if not token_mask & (1 << token)]
 
     def _next_scratchpad(self, scratchpad: str, private_note: str) -> str:
         if not private_note:
             return scratchpad
         update = f"Private note: {private_note}"
+        if scratchpad.endswith(update):
+            return scratchpad
         combined = f"{scratchpad}\n{update}".strip()
         return combined[-4000:]
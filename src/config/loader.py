@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from collections import OrderedDict
+from dataclasses import replace
 from pathlib import Path
 from typing import Any
 
@@ -7,20 +9,49 @@ import yaml
 
 from src.config.settings import SimulationConfig
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # LibYAML bindings not available
+    from yaml import SafeLoader as _YamlLoader
+
+
+_CONFIG_CACHE_SIZE = 8
+_CONFIG_CACHE: OrderedDict[tuple[str, float, int], SimulationConfig] = OrderedDict()
+
 
 def load_simulation_config(path: str = "config.yml") -> SimulationConfig:
     config_path = Path(path)
     if not config_path.exists():
         raise FileNotFoundError(f"Config file not found: {config_path}")
 
+    st = config_path.stat()
+    key = (str(config_path.resolve()), st.st_mtime, st.st_size)
+    cached = _CONFIG_CACHE.get(key)
+    if cached is not None:
+        _CONFIG_CACHE.move_to_end(key)
+        return _copy_config(cached)
+
     with config_path.open("r", encoding="utf-8") as handle:
-        data = yaml.safe_load(handle) or {}
+        data = yaml.load(handle, Loader=_YamlLoader) or {}
 
     if not isinstance(data, dict):
         raise ValueError("config.yml must contain a top-level mapping")
 
     normalized = _normalize_config_values(data)
-    return SimulationConfig(**normalized)
+    config = SimulationConfig(**normalized)
+    _CONFIG_CACHE[key] = config
+    while len(_CONFIG_CACHE) > _CONFIG_CACHE_SIZE:
+        _CONFIG_CACHE.popitem(last=False)
+    return _copy_config(config)
+
+
+def _copy_config(config: SimulationConfig) -> SimulationConfig:
+    # Callers may mutate the returned config; keep the cached instance's containers private.
+    return replace(
+        config,
+        agent_models=dict(config.agent_models),
+        strategy_doc_players=list(config.strategy_doc_players),
+    )
 
 
 def _normalize_config_values(data: dict[str, Any]) -> dict[str, Any]:
@@ -59,4 +90,24 @@ def _normalize_config_values(data: dict[str, Any]) -> dict[str, Any]:
 
     if "strategy_doc_enabled" in values:
         values["strategy_doc_enabled"] = bool(values["strategy_doc_enabled"])
+    if "log_raw_llm_responses" in values:
+        values["log_raw_llm_responses"] = bool(values["log_raw_llm_responses"])
+    if "summary_logs_only" in values:
+        values["summary_logs_only"] = bool(values["summary_logs_only"])
+    if "prompt_cache_enabled" in values:
+        values["prompt_cache_enabled"] = bool(values["prompt_cache_enabled"])
+    for key in (
+        "negotiation_timeout_seconds",
+        "vote_timeout_seconds",
+        "vote_change_timeout_seconds",
+        "referee_timeout_seconds",
+    ):
+        if key in values:
+            values[key] = int(values[key]) if values[key] else None
+    if "agent_max_retries" in values:
+        values["agent_max_retries"] = int(values["agent_max_retries"])
+    if "llm_max_parallel" in values:
+        values["llm_max_parallel"] = int(values["llm_max_parallel"])
+    if "preflight_cache_ttl_seconds" in values:
+        values["preflight_cache_ttl_seconds"] = int(values["preflight_cache_ttl_seconds"] or 0)
     return values
@@ -3,7 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class SimulationConfig:
     aws_profile: str | None = None
     region: str = "us-west-2"
@@ -22,7 +22,17 @@ class SimulationConfig:
     request_retries: int = 2
     request_retry_backoff_seconds: tuple[float, float] = (1.0, 2.0)
     llm_request_timeout_seconds: int = 45
+    negotiation_timeout_seconds: int | None = None
+    vote_timeout_seconds: int | None = None
+    vote_change_timeout_seconds: int | None = None
+    referee_timeout_seconds: int | None = None
+    llm_max_parallel: int = 4
+    agent_max_retries: int = 5
+    preflight_cache_ttl_seconds: int = 3600
+    prompt_cache_enabled: bool = True
     log_root: str = "logs"
+    log_raw_llm_responses: bool = True
+    summary_logs_only: bool = False
     e2e_rounds: int = 3
     agent_models: dict[str, str] = field(default_factory=dict)
     strategy_doc_enabled: bool = True
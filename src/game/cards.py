@@ -15,27 +15,32 @@ def _seq(code: str) -> tuple[Season, ...]:
     return tuple(_SEASON_MAP[ch] for ch in code)
 
 
-PROPOSAL_CARDS: tuple[ProposalCard, ...] = (
-    ProposalCard("Winter Solstice", _seq("WWP"), _seq("WWWW")),
-    ProposalCard("Winter Awake", _seq("WPP"), _seq("WSSA")),
-    ProposalCard("Winter in Chorus", _seq("WPS"), _seq("WWWA")),
-    ProposalCard("Winter All-Aglow", _seq("WWW"), _seq("PPAA")),
-    ProposalCard("Winter in Harmony", _seq("WWP"), _seq("PPWW")),
-    ProposalCard("Spring Equinox", _seq("PPS"), _seq("PPPP")),
-    ProposalCard("Spring-At-The-Door", _seq("PSS"), _seq("PAAW")),
-    ProposalCard("Spring In Quiet", _seq("PPP"), _seq("SSWW")),
-    ProposalCard("Spring Overflowing", _seq("PPS"), _seq("SSPP")),
-    ProposalCard("Spring In Bloom", _seq("PSA"), _seq("PPPW")),
-    ProposalCard("Autumn Equinox", _seq("AAW"), _seq("AAAA")),
-    ProposalCard("Autumn In Flight", _seq("AAA"), _seq("WWPP")),
-    ProposalCard("Autumn In Memory", _seq("AAW"), _seq("WWAA")),
-    ProposalCard("Autumn In Mourning", _seq("AWW"), _seq("APPS")),
-    ProposalCard("Autumn In Vain", _seq("AWP"), _seq("AAAW")),
-    ProposalCard("Summer Solstice", _seq("SSA"), _seq("SSSS")),
-    ProposalCard("Summer Singing", _seq("SSA"), _seq("AASS")),
-    ProposalCard("Summer Bursting", _seq("SSS"), _seq("AAPP")),
-    ProposalCard("Summer Waking", _seq("SAW"), _seq("SSSP")),
-    ProposalCard("Summer in Glory", _seq("SAA"), _seq("SWWP")),
+_PROPOSAL_CODES: tuple[tuple[str, str, str], ...] = (
+    ("Winter Solstice", "WWP", "WWWW"),
+    ("Winter Awake", "WPP", "WSSA"),
+    ("Winter in Chorus", "WPS", "WWWA"),
+    ("Winter All-Aglow", "WWW", "PPAA"),
+    ("Winter in Harmony", "WWP", "PPWW"),
+    ("Spring Equinox", "PPS", "PPPP"),
+    ("Spring-At-The-Door", "PSS", "PAAW"),
+    ("Spring In Quiet", "PPP", "SSWW"),
+    ("Spring Overflowing", "PPS", "SSPP"),
+    ("Spring In Bloom", "PSA", "PPPW"),
+    ("Autumn Equinox", "AAW", "AAAA"),
+    ("Autumn In Flight", "AAA", "WWPP"),
+    ("Autumn In Memory", "AAW", "WWAA"),
+    ("Autumn In Mourning", "AWW", "APPS"),
+    ("Autumn In Vain", "AWP", "AAAW"),
+    ("Summer Solstice", "SSA", "SSSS"),
+    ("Summer Singing", "SSA", "AASS"),
+    ("Summer Bursting", "SSS", "AAPP"),
+    ("Summer Waking", "SAW", "SSSP"),
+    ("Summer in Glory", "SAA", "SWWP"),
+)
+
+
+PROPOSAL_CARDS: tuple[ProposalCard, ...] = tuple(
+    ProposalCard(name, _seq(majority), _seq(consensus)) for name, majority, consensus in _PROPOSAL_CODES
 )
 
 
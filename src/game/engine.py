@@ -7,6 +7,7 @@ from src.config.settings import SimulationConfig
 from src.game.cards import EFFECT_CARDS, PROPOSAL_CARDS
 from src.game.models import (
     CHARACTER_ORDER,
+    SEASON_IDX,
     Character,
     Contract,
     ContractStatus,
@@ -28,6 +29,36 @@ CHARACTER_INTERESTS: dict[Character, dict[int, Season]] = {
 }
 
 
+# Enum .value is a descriptor call; these tables make the export and transcript paths plain dict lookups.
+CHAR_V: dict[Character, str] = {c: c.value for c in Character}
+SEASON_NAMES: tuple[str, ...] = tuple(s.value for s in Season)
+OUTCOME_V: dict[OutcomeType, str] = {o: o.value for o in OutcomeType}
+PHASE_V: dict[Phase, str] = {p: p.value for p in Phase}
+
+# Voting runs in token order; unclaimed tokens are handed out from the back of the line first.
+VOTE_ORDER: tuple[int, ...] = (1, 2, 3, 4)
+FORCED_TOKEN_ORDER: tuple[int, ...] = (3, 4, 2, 1)
+NO_TOKENS: tuple[None, ...] = (None,) * 5
+
+# One bit per toggle effect, assigned in name order so set bits list alphabetically.
+TOGGLE_BITS: dict[str, int] = {
+    name: 1 << i
+    for i, name in enumerate(sorted({card.name for card in EFFECT_CARDS if card.kind == EffectKind.TOGGLE}))
+}
+SHOTGUN_BIT: int = TOGGLE_BITS["Shotgun"]
+
+# Every other player, in CHARACTER_ORDER, for each character.
+OTHER_PLAYERS: dict[Character, tuple[Character, ...]] = {
+    character: tuple(other for other in CHARACTER_ORDER if other is not character) for character in CHARACTER_ORDER
+}
+
+# (character, strong +2 bell index, moderate +1 bell index, avoided -1 bell index), in CHARACTER_ORDER.
+SCORE_WEIGHTS: tuple[tuple[Character, int, int, int], ...] = tuple(
+    (character, SEASON_IDX[interests[2]], SEASON_IDX[interests[1]], SEASON_IDX[interests[-1]])
+    for character, interests in ((c, CHARACTER_INTERESTS[c]) for c in CHARACTER_ORDER)
+)
+
+
 class RulesEngine:
     def __init__(self, config: SimulationConfig):
         self.config = config
@@ -49,6 +80,7 @@ class RulesEngine:
             for holder in CHARACTER_ORDER
         }
         state.spendable_holdings = self._copy_holdings(state.holdings)
+        state.holding_totals = {c: 5 for c in CHARACTER_ORDER}
         state.scratchpads = {c: "" for c in CHARACTER_ORDER}
         state.metadata = {
             "seed": self.config.seed,
@@ -73,13 +105,20 @@ class RulesEngine:
             1: {OutcomeType.MAJORITY: effects[2], OutcomeType.CONSENSUS: effects[3]},
         }
         self.state.phase = Phase.NEGOTIATION
-        self.state.token_assignments = {}
-        self.state.votes = {}
+        # Per-round containers are reset in place rather than reallocated.
+        self.state.token_assignments[:] = NO_TOKENS
+        self.state.token_mask = 0
+        self.state.votes.clear()
         self.state.voting_cursor = 0
-        self.state.vote_changes = {c: 0 for c in CHARACTER_ORDER}
-        self.state.word_counts = {c: 0 for c in CHARACTER_ORDER}
-        self.state.muted_players = set()
-        self.state.spendable_holdings = self._copy_holdings(self.state.holdings)
+        vote_changes = self.state.vote_changes
+        word_counts = self.state.word_counts
+        for character in CHARACTER_ORDER:
+            vote_changes[character] = 0
+            word_counts[character] = 0
+        self.state.muted_players.clear()
+        spendable = self.state.spendable_holdings
+        for holder, owned in self.state.holdings.items():
+            spendable[holder].update(owned)
         self.state.metadata["round_started_at"] = time.time()
 
     def _copy_holdings(
@@ -92,74 +131,81 @@ class RulesEngine:
 
     def _draw_effect(self) -> EffectCard:
         if not self.state.effect_deck:
-            self.state.effect_deck = list(EFFECT_CARDS)
-            self.rng.shuffle(self.state.effect_deck)
+            self._refill_effect_deck()
         return self.state.effect_deck.pop()
 
+    def _refill_effect_deck(self) -> None:
+        # Refill the existing list in place; same rng.shuffle draws as a fresh list.
+        deck = self.state.effect_deck
+        deck[:] = EFFECT_CARDS
+        self.rng.shuffle(deck)
+
     def record_utterance(self, player: Character, text: str, binding_allowed: bool) -> tuple[str, bool]:
         text = (text or "").strip()
         if not text:
             return "", player in self.state.muted_players
-        if self.state.phase != Phase.NEGOTIATION:
-            self.state.transcript.append(f"{player.value}: {text}")
+        if self.state.phase is not Phase.NEGOTIATION:
+            self.state.transcript.append(f"{CHAR_V[player]}: {text}")
             return text, player in self.state.muted_players
 
         current_words = self.state.word_counts[player]
-        words = text.split()
         remaining = self.config.negotiation_word_cap - current_words
         if remaining <= 0:
             self.state.muted_players.add(player)
             return "", True
-        kept_words = words[:remaining]
+        # maxsplit stops scanning once the cap is reached; the tail element is dropped.
+        kept_words = text.split(maxsplit=remaining)[:remaining]
         kept_text = " ".join(kept_words)
         self.state.word_counts[player] += len(kept_words)
         if self.state.word_counts[player] >= self.config.negotiation_word_cap:
             self.state.muted_players.add(player)
         binding_tag = "[binding]" if binding_allowed else "[non-binding]"
-        self.state.transcript.append(f"{player.value} {binding_tag}: {kept_text}")
+        self.state.transcript.append(f"{CHAR_V[player]} {binding_tag}: {kept_text}")
         return kept_text, player in self.state.muted_players
 
     def can_take_token(self, player: Character, token: int) -> bool:
-        if self.state.phase != Phase.NEGOTIATION:
+        if self.state.phase is not Phase.NEGOTIATION:
             return False
-        if token not in (1, 2, 3, 4):
+        if token not in VOTE_ORDER:
             return False
-        if token in self.state.token_assignments:
+        assignments = self.state.token_assignments
+        if assignments[token] is not None:
             return False
-        if player in self.state.token_assignments.values():
+        if player in assignments:
             return False
         if token == 3:
             return True
-        return 3 in self.state.token_assignments
+        return assignments[3] is not None
 
     def take_token(self, player: Character, token: int) -> bool:
         if not self.can_take_token(player, token):
             return False
         self.state.token_assignments[token] = player
-        self.state.transcript.append(f"{player.value} took vote token {token}")
+        self.state.token_mask |= 1 << token
+        self.state.transcript.append(f"{CHAR_V[player]} took vote token {token}")
         return True
 
     def all_tokens_taken(self) -> bool:
-        return len(self.state.token_assignments) == 4
+        return self.state.token_mask.bit_count() == 4
 
     def enter_voting_phase(self) -> None:
         self.state.phase = Phase.VOTING
         self.state.transcript.append("Voting phase begins")
 
     def cast_vote(self, player: Character, proposal_index: int) -> bool:
-        if self.state.phase != Phase.VOTING:
+        if self.state.phase is not Phase.VOTING:
             return False
         if proposal_index not in (0, 1):
             return False
-        expected_token = [1, 2, 3, 4][self.state.voting_cursor]
-        if self.state.token_assignments.get(expected_token) != player:
+        expected_token = VOTE_ORDER[self.state.voting_cursor]
+        if self.state.token_assignments[expected_token] is not player:
             return False
         self.state.votes[player] = proposal_index
         self.state.voting_cursor += 1
         return True
 
     def force_vote_by_referee(self, player: Character, proposal_index: int) -> bool:
-        if self.state.phase != Phase.VOTING:
+        if self.state.phase is not Phase.VOTING:
             return False
         if proposal_index not in (0, 1):
             return False
@@ -169,7 +215,7 @@ class RulesEngine:
         return True
 
     def can_change_vote(self, target: Character) -> bool:
-        return self.state.phase == Phase.VOTING and target in self.state.votes and self.state.vote_changes[target] < 2
+        return self.state.phase is Phase.VOTING and target in self.state.votes and self.state.vote_changes[target] < 2
 
     def change_vote_using_target_token(
         self,
@@ -177,17 +223,22 @@ class RulesEngine:
         target: Character,
         new_proposal_index: int,
     ) -> bool:
-        if not self.can_change_vote(target):
+        if new_proposal_index not in (0, 1) or not self.can_change_vote(target):
             return False
-        if self.state.spendable_holdings[actor][target] <= 0:
+        spendable = self.state.spendable_holdings[actor]
+        if spendable[target] <= 0:
             return False
-        self.state.spendable_holdings[actor][target] -= 1
-        self.state.holdings[actor][target] -= 1
-        self.state.holdings[target][target] += 1
+        holdings = self.state.holdings
+        spendable[target] -= 1
+        holdings[actor][target] -= 1
+        holdings[target][target] += 1
+        totals = self.state.holding_totals
+        totals[actor] -= 1
+        totals[target] += 1
         self.state.votes[target] = new_proposal_index
         self.state.vote_changes[target] += 1
         self.state.transcript.append(
-            f"{actor.value} changed {target.value}'s vote using a {target.value} token"
+            f"{CHAR_V[actor]} changed {CHAR_V[target]}'s vote using a {CHAR_V[target]} token"
         )
         return True
 
@@ -197,17 +248,22 @@ class RulesEngine:
         target: Character,
         new_proposal_index: int,
     ) -> bool:
-        if not self.can_change_vote(target):
+        if new_proposal_index not in (0, 1) or not self.can_change_vote(target):
             return False
-        if self.state.spendable_holdings[actor][actor] < 3:
+        spendable = self.state.spendable_holdings[actor]
+        if spendable[actor] < 3:
             return False
-        self.state.spendable_holdings[actor][actor] -= 3
-        self.state.holdings[actor][actor] -= 3
-        self.state.holdings[target][actor] += 3
+        holdings = self.state.holdings
+        spendable[actor] -= 3
+        holdings[actor][actor] -= 3
+        holdings[target][actor] += 3
+        totals = self.state.holding_totals
+        totals[actor] -= 3
+        totals[target] += 3
         self.state.votes[target] = new_proposal_index
         self.state.vote_changes[target] += 1
         self.state.transcript.append(
-            f"{actor.value} forced {target.value}'s vote change by giving 3 own tokens"
+            f"{CHAR_V[actor]} forced {CHAR_V[target]}'s vote change by giving 3 own tokens"
         )
         return True
 
@@ -222,41 +278,42 @@ class RulesEngine:
         contract.notes = notes
 
     def resolve_round(self) -> RoundResult:
-        self.state.phase = Phase.RESOLUTION
-        vote_counts = {0: 0, 1: 0}
-        for proposal in self.state.votes.values():
-            vote_counts[proposal] += 1
+        state = self.state
+        state.phase = Phase.RESOLUTION
+        votes = state.votes
+        # Votes are 0/1, so the sum counts votes for proposal 1.
+        for_second = sum(votes.values())
+        for_first = len(votes) - for_second
 
         passed: int | None
         outcome: OutcomeType | None
-        winning_votes = max(vote_counts.values()) if vote_counts else 0
-
-        if vote_counts[0] == vote_counts[1]:
-            if "Shotgun" in self.state.active_toggles and self.state.token_assignments.get(1) in self.state.votes:
-                tie_break_player = self.state.token_assignments[1]
-                passed = self.state.votes[tie_break_player]
-                outcome = OutcomeType.MAJORITY
-                winning_votes = 3
-            else:
-                passed = None
-                outcome = None
-        else:
-            passed = 0 if vote_counts[0] > vote_counts[1] else 1
+        winning_votes = max(for_first, for_second)
+
+        if for_first != for_second:
+            passed = int(for_second > for_first)
             outcome = OutcomeType.CONSENSUS if winning_votes == 4 else OutcomeType.MAJORITY
+        elif state.active_toggles & SHOTGUN_BIT and state.token_assignments[1] in votes:
+            passed = votes[state.token_assignments[1]]
+            outcome = OutcomeType.MAJORITY
+            winning_votes = 3
+        else:
+            passed = None
+            outcome = None
 
         applied_effect: str | None = None
         if passed is not None and outcome is not None:
-            proposal = self.state.current_proposals[passed]
-            seasons = proposal.consensus if outcome == OutcomeType.CONSENSUS else proposal.majority
-            for season in seasons:
-                self.state.bells[season] += 1
-            effect = self.state.current_effects[passed][outcome]
+            proposal = state.current_proposals[passed]
+            slots = proposal.consensus_idx if outcome is OutcomeType.CONSENSUS else proposal.majority_idx
+            bells = state.bells
+            for slot in slots:
+                bells[slot] += 1
+            effect = state.current_effects[passed][outcome]
             applied_effect = effect.name
             self._apply_effect(effect)
 
-        # Effects are reshuffled each round.
-        self.state.effect_deck = list(EFFECT_CARDS)
-        self.rng.shuffle(self.state.effect_deck)
+        # Effects are reshuffled each round (RULES.md); return them to the pile and let the
+        # next _draw_effect reshuffle lazily, so no shuffle runs after the final round.
+        state.effect_deck.clear()
 
         result = RoundResult(
             passed_proposal_index=passed,
@@ -265,19 +322,16 @@ class RulesEngine:
             applied_effect=applied_effect,
         )
 
-        self.state.round_number += 1
-        if self.state.round_number > self.state.max_rounds:
-            self.state.phase = Phase.COMPLETE
+        state.round_number += 1
+        if state.round_number > state.max_rounds:
+            state.phase = Phase.COMPLETE
         return result
 
     def _apply_effect(self, effect: EffectCard) -> None:
-        if effect.kind == EffectKind.NULL:
+        if effect.kind is EffectKind.NULL:
             return
-        if effect.kind == EffectKind.TOGGLE:
-            if effect.name in self.state.active_toggles:
-                self.state.active_toggles.remove(effect.name)
-            else:
-                self.state.active_toggles.add(effect.name)
+        if effect.kind is EffectKind.TOGGLE:
+            self.state.active_toggles ^= TOGGLE_BITS[effect.name]
             self.state.transcript.append(f"Toggle effect updated: {effect.name}")
             return
 
@@ -292,44 +346,54 @@ class RulesEngine:
             self.state.transcript.append("Transformation triggered (no-op in v1 automation)")
 
     def _apply_highway_robbery(self) -> None:
-        for thief in CHARACTER_ORDER:
-            possible_targets = [
-                target
-                for target in CHARACTER_ORDER
-                if target != thief and sum(self.state.holdings[target].values()) > 0
-            ]
+        order = CHARACTER_ORDER
+        choice = self.rng.choice
+        holdings = self.state.holdings
+        totals = self.state.holding_totals
+        for thief in order:
+            possible_targets = [target for target in order if target != thief and totals[target] > 0]
             if not possible_targets:
                 continue
-            target = self.rng.choice(possible_targets)
-            available_owners = [owner for owner, count in self.state.holdings[target].items() if count > 0]
-            if not available_owners:
-                continue
-            owner = self.rng.choice(available_owners)
-            self.state.holdings[target][owner] -= 1
-            self.state.holdings[thief][owner] += 1
+            target = choice(possible_targets)
+            target_holdings = holdings[target]
+            # totals[target] > 0 guarantees at least one owner here.
+            owner = choice([owner for owner, count in target_holdings.items() if count > 0])
+            target_holdings[owner] -= 1
+            holdings[thief][owner] += 1
+            totals[target] -= 1
+            totals[thief] += 1
 
     def _apply_jubilee(self) -> None:
-        self.state.holdings = {
-            holder: {owner: (5 if holder == owner else 0) for owner in CHARACTER_ORDER}
-            for holder in CHARACTER_ORDER
-        }
+        holdings = self.state.holdings
+        for holder, owned in holdings.items():
+            for owner in owned:
+                owned[owner] = 5 if holder == owner else 0
+        totals = self.state.holding_totals
+        for holder in totals:
+            totals[holder] = 5
 
     def _apply_secret_santa(self) -> None:
-        for giver in CHARACTER_ORDER:
-            if self.state.holdings[giver][giver] <= 0:
+        holdings = self.state.holdings
+        totals = self.state.holding_totals
+        # One batched draw picks a slot among each giver's three possible recipients.
+        picks = self.rng.choices(range(len(CHARACTER_ORDER) - 1), k=len(CHARACTER_ORDER))
+        for giver, pick in zip(CHARACTER_ORDER, picks):
+            giver_holdings = holdings[giver]
+            if giver_holdings[giver] <= 0:
                 continue
-            recipients = [p for p in CHARACTER_ORDER if p != giver]
-            recipient = self.rng.choice(recipients)
-            self.state.holdings[giver][giver] -= 1
-            self.state.holdings[recipient][giver] += 1
+            recipient = OTHER_PLAYERS[giver][pick]
+            giver_holdings[giver] -= 1
+            holdings[recipient][giver] += 1
+            totals[giver] -= 1
+            totals[recipient] += 1
 
     def get_token_order(self) -> list[Character]:
-        return [self.state.token_assignments[token] for token in [1, 2, 3, 4]]
+        return [self.state.token_assignments[token] for token in VOTE_ORDER]
 
     def force_remaining_tokens_seeded(self) -> list[tuple[Character, int]]:
-        taken_players = set(self.state.token_assignments.values())
+        taken_players = set(self.state.token_assignments)
         remaining_players = [p for p in CHARACTER_ORDER if p not in taken_players]
-        remaining_tokens = [t for t in [3, 4, 2, 1] if t not in self.state.token_assignments]
+        remaining_tokens = [t for t in FORCED_TOKEN_ORDER if self.state.token_assignments[t] is None]
         assignments: list[tuple[Character, int]] = []
         for token in remaining_tokens:
             if token == 3:
@@ -344,53 +408,51 @@ class RulesEngine:
         return assignments
 
     def score_players(self) -> dict[Character, int]:
-        scores: dict[Character, int] = {}
-        for character in CHARACTER_ORDER:
-            interests = CHARACTER_INTERESTS[character]
-            score = (
-                2 * self.state.bells[interests[2]]
-                + self.state.bells[interests[1]]
-                - self.state.bells[interests[-1]]
-            )
-            scores[character] = score
-        return scores
+        bells = self.state.bells
+        return {
+            character: 2 * bells[strong] + bells[moderate] - bells[avoided]
+            for character, strong, moderate, avoided in SCORE_WEIGHTS
+        }
 
     def export_public_state(self) -> dict[str, object]:
-        proposals = self.state.current_proposals or ()
+        state = self.state
+        proposals = state.current_proposals or ()
         current_effects = {
             idx: {
-                outcome.value: effect.name
+                OUTCOME_V[outcome]: effect.name
                 for outcome, effect in outcome_map.items()
             }
-            for idx, outcome_map in self.state.current_effects.items()
+            for idx, outcome_map in state.current_effects.items()
         }
         return {
-            "round": self.state.round_number,
-            "phase": self.state.phase.value,
+            "round": state.round_number,
+            "phase": PHASE_V[state.phase],
             "proposals": [p.name for p in proposals],
             "effects": current_effects,
-            "bells": {season.value: count for season, count in self.state.bells.items()},
-            "token_assignments": {str(k): v.value for k, v in self.state.token_assignments.items()},
-            "votes": {k.value: v for k, v in self.state.votes.items()},
-            "vote_changes": {k.value: v for k, v in self.state.vote_changes.items()},
+            "bells": dict(zip(SEASON_NAMES, state.bells)),
+            "token_assignments": {
+                token: CHAR_V[holder] for token, holder in enumerate(state.token_assignments) if holder is not None
+            },
+            "votes": {CHAR_V[k]: v for k, v in state.votes.items()},
+            "vote_changes": {CHAR_V[k]: v for k, v in state.vote_changes.items()},
             "holdings": {
-                holder.value: {owner.value: count for owner, count in owned.items()}
-                for holder, owned in self.state.holdings.items()
+                CHAR_V[holder]: {CHAR_V[owner]: count for owner, count in owned.items()}
+                for holder, owned in state.holdings.items()
             },
             "spendable_holdings": {
-                holder.value: {owner.value: count for owner, count in owned.items()}
-                for holder, owned in self.state.spendable_holdings.items()
+                CHAR_V[holder]: {CHAR_V[owner]: count for owner, count in owned.items()}
+                for holder, owned in state.spendable_holdings.items()
             },
-            "toggles": sorted(self.state.active_toggles),
-            "word_counts": {k.value: v for k, v in self.state.word_counts.items()},
+            "toggles": [name for name, bit in TOGGLE_BITS.items() if state.active_toggles & bit],
+            "word_counts": {CHAR_V[k]: v for k, v in state.word_counts.items()},
             "contracts": {
                 k: {
                     "text": c.text,
-                    "parties": [p.value for p in c.parties],
+                    "parties": [CHAR_V[p] for p in c.parties],
                     "status": c.status.value,
                     "round": c.created_round,
                     "notes": c.notes,
                 }
-                for k, c in self.state.contracts.items()
+                for k, c in state.contracts.items()
             },
         }
@@ -20,6 +20,10 @@ class Season(str, Enum):
     WINTER = "winter"
 
 
+# Position of each season in GameState.bells (declaration order).
+SEASON_IDX: dict[Season, int] = {s: i for i, s in enumerate(Season)}
+
+
 class Character(str, Enum):
     CARMICHAEL = "Carmichael"
     QUINCY = "Quincy"
@@ -45,21 +49,28 @@ class ContractStatus(str, Enum):
     BREACHED = "breached"
 
 
-@dataclass
+@dataclass(slots=True)
 class ProposalCard:
     name: str
     majority: tuple[Season, ...]
     consensus: tuple[Season, ...]
+    majority_idx: tuple[int, ...] = field(init=False, repr=False)
+    consensus_idx: tuple[int, ...] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # Bell slots per outcome, resolved once so resolution skips the enum lookups.
+        self.majority_idx = tuple(SEASON_IDX[s] for s in self.majority)
+        self.consensus_idx = tuple(SEASON_IDX[s] for s in self.consensus)
 
 
-@dataclass
+@dataclass(slots=True)
 class EffectCard:
     name: str
     kind: EffectKind
     description: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Contract:
     contract_id: str
     text: str
@@ -69,7 +80,7 @@ class Contract:
     notes: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class RoundResult:
     passed_proposal_index: int | None
     outcome_type: OutcomeType | None
@@ -77,13 +88,15 @@ class RoundResult:
     applied_effect: str | None
 
 
-@dataclass
+@dataclass(slots=True)
 class GameState:
     max_rounds: int
     round_number: int = 1
     phase: Phase = Phase.DEAL
-    bells: dict[Season, int] = field(default_factory=lambda: {s: 0 for s in Season})
-    token_assignments: dict[int, Character] = field(default_factory=dict)
+    bells: list[int] = field(default_factory=lambda: [0] * len(Season))
+    # Indexed by token number 1-4; slot 0 is unused.
+    token_assignments: list[Character | None] = field(default_factory=lambda: [None] * 5)
+    token_mask: int = 0
     votes: dict[Character, int] = field(default_factory=dict)
     vote_changes: dict[Character, int] = field(default_factory=dict)
     voting_cursor: int = 0
@@ -91,8 +104,10 @@ class GameState:
     muted_players: set[Character] = field(default_factory=set)
     holdings: dict[Character, dict[Character, int]] = field(default_factory=dict)
     spendable_holdings: dict[Character, dict[Character, int]] = field(default_factory=dict)
+    # Running sum of each holder's promise tokens, kept in step with holdings.
+    holding_totals: dict[Character, int] = field(default_factory=dict)
     contracts: dict[str, Contract] = field(default_factory=dict)
-    active_toggles: set[str] = field(default_factory=set)
+    active_toggles: int = 0
     proposal_deck: list[ProposalCard] = field(default_factory=list)
     effect_deck: list[EffectCard] = field(default_factory=list)
     current_proposals: tuple[ProposalCard, ProposalCard] | None = None
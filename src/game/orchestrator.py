@@ -4,11 +4,11 @@ import asyncio
 import hashlib
 import random
 import re
+import secrets
 import time
-import uuid
 from contextlib import nullcontext
-from dataclasses import replace
-from typing import Any
+from dataclasses import asdict, dataclass, replace
+from typing import Any, Coroutine
 
 from rich.live import Live
 
@@ -18,47 +18,125 @@ from src.game.engine import RulesEngine
 from src.game.models import CHARACTER_ORDER, Character, Contract, Phase
 from src.llm.bedrock_client import BedrockConverseClient
 from src.llm.json_utils import try_extract_json_object
-from src.logging.game_logger import GameLogger
+from src.logging.game_logger import GameLogger, SummaryGameLogger
 from src.referee.referee_agent import RefereeAgent
 from src.ui.game_display import GameDisplay
 
 
+# Every LLM-backed actor, players in turn order then the referee.
+_AGENT_NAMES: tuple[str, ...] = tuple(character.value for character in CHARACTER_ORDER) + ("Referee",)
+
+# Matches Live(refresh_per_second=8); state changes in between are coalesced into one render.
+_RENDER_INTERVAL_SECONDS = 1 / 8
+
+_CHARACTER_BY_KEY: dict[str, Character] = {
+    "carmichael": Character.CARMICHAEL,
+    "quincy": Character.QUINCY,
+    "medici": Character.MEDICI,
+    "dambrosio": Character.DAMBROSIO,
+}
+_CHARACTER_ALIASES: tuple[tuple[str, Character], ...] = (
+    ("carmichael", Character.CARMICHAEL),
+    ("quincy", Character.QUINCY),
+    ("medici", Character.MEDICI),
+    ("d'ambrosio", Character.DAMBROSIO),
+    ("dambrosio", Character.DAMBROSIO),
+)
+_STRIP_BACKTICKS = str.maketrans("", "", "`")
+_COMMITMENT_RE = re.compile(
+    r"(?i)^(?:\d+[.)]\s*)?"
+    r"(Carmichael|Quincy|Medici|D'Ambrosio)\s+"
+    r"(?:made\s+)?(?:a\s+)?(?:binding\s+)?"
+    r"(?:commitment|commitments)?\s*"
+    r"(?:to:?\s*|committed to\s+)"
+    r"(.+)$"
+)
+_ENFORCEMENT_KEYWORDS = ("final vote state", "authoritative", "binding final vote", "final vote position")
+# Every keyword contains one of these, so most lines are rejected with two substring scans.
+_ENFORCEMENT_STEMS = ("final vote", "authoritative")
+_ENFORCED_VOTE_RE = re.compile(
+    r"(?i)\b(?:set|shift(?:ed)?|redirect(?:ed)?)\s+"
+    r"(Carmichael|Quincy|Medici|D'Ambrosio)\s+"
+    r"(?:to|toward)\s+proposal\s*([01])"
+)
+_ENFORCED_VOTE_FALLBACK_RE = re.compile(
+    r"(?i)\b(Carmichael|Quincy|Medici|D'Ambrosio)\b.{0,50}\bproposal\s*([01])\b"
+)
+
+
+@dataclass(slots=True)
+class UsageBucket:
+    input_tokens: int = 0
+    output_tokens: int = 0
+    total_tokens: int = 0
+    cache_read_tokens: int = 0
+    cache_write_tokens: int = 0
+
+    def add(self, other: UsageBucket) -> None:
+        self.input_tokens += other.input_tokens
+        self.output_tokens += other.output_tokens
+        self.total_tokens += other.total_tokens
+        self.cache_read_tokens += other.cache_read_tokens
+        self.cache_write_tokens += other.cache_write_tokens
+
+
 class SimulationOrchestrator:
     def __init__(self, config: SimulationConfig, visual: bool = True):
         self.config = config
         self.visual = visual
         self.engine = RulesEngine(config)
         self._llm_clients_by_model: dict[str, BedrockConverseClient] = {}
+        self._llm_semaphore = asyncio.Semaphore(max(1, config.llm_max_parallel))
+        # Per-operation request timeouts; unset ones fall back to llm_request_timeout_seconds.
+        self._llm_timeouts = {
+            "negotiation": config.negotiation_timeout_seconds or config.llm_request_timeout_seconds,
+            "voting": config.vote_timeout_seconds or config.llm_request_timeout_seconds,
+            "vote_change": config.vote_change_timeout_seconds or config.llm_request_timeout_seconds,
+            "referee": config.referee_timeout_seconds or config.llm_request_timeout_seconds,
+        }
         self.llm = self._client_for_model(config.model_id)
+        self._agent_models = {name: self._model_for_actor(name) for name in _AGENT_NAMES}
         strategy_players = set()
         if config.strategy_doc_enabled:
             strategy_players = {name.strip() for name in config.strategy_doc_players}
         self.player_agents = {
             character: PlayerAgent(
                 name=character.value,
-                llm=self._client_for_model(self._model_for_actor(character.value)),
+                llm=self._client_for_model(self._agent_models[character.value]),
                 character=character,
                 negotiation_word_cap=config.negotiation_word_cap,
                 use_strategy_doc=character.value in strategy_players,
+                include_raw=config.log_raw_llm_responses,
             )
             for character in CHARACTER_ORDER
         }
-        self.referee = RefereeAgent(name="Referee", llm=self._client_for_model(self._model_for_actor("Referee")))
+        self.referee = RefereeAgent(
+            name="Referee",
+            llm=self._client_for_model(self._agent_models["Referee"]),
+            include_raw=config.log_raw_llm_responses,
+        )
         self._referee_scratchpad = ""
-        self.game_id = str(uuid.uuid4())[:8]
-        self.logger = GameLogger(root=config.log_root, game_id=self.game_id)
-        self.display = GameDisplay()
+        # Rendered scratchpads, keyed by display name and refreshed in place on each render.
+        self._scratchpads_view: dict[str, str] = dict.fromkeys(_AGENT_NAMES, "")
+        # Monotonic start of the current round; engine metadata keeps the wall-clock time for logs.
+        self._round_started_at: float | None = None
+        self._transcript_tail_cache: tuple[tuple[int, int], str] = ((0, 0), "")
+        self.game_id = secrets.token_hex(4)
+        logger_cls = SummaryGameLogger if config.summary_logs_only else GameLogger
+        self.logger = logger_cls(root=config.log_root, game_id=self.game_id)
+        self.display = GameDisplay(enabled=visual)
         self.rng = random.Random(config.seed)
         self._live: Live | None = None
-        self._usage_actor_order = [character.value for character in CHARACTER_ORDER] + ["Referee"]
-        self._usage_totals = self._new_usage_bucket()
-        self._usage_round = self._new_usage_bucket()
+        self._render_dirty = False
+        self._usage_actor_order = list(_AGENT_NAMES)
+        self._usage_totals = UsageBucket()
+        self._usage_round = UsageBucket()
         self._usage_requests_total = 0
         self._usage_requests_round = 0
         self._usage_requests_by_actor_total = {name: 0 for name in self._usage_actor_order}
         self._usage_requests_by_actor_round = {name: 0 for name in self._usage_actor_order}
-        self._usage_by_actor_total = {name: self._new_usage_bucket() for name in self._usage_actor_order}
-        self._usage_by_actor_round = {name: self._new_usage_bucket() for name in self._usage_actor_order}
+        self._usage_by_actor_total = {name: UsageBucket() for name in self._usage_actor_order}
+        self._usage_by_actor_round = {name: UsageBucket() for name in self._usage_actor_order}
 
     async def run(self) -> dict[str, Any]:
         context = (
@@ -68,106 +146,121 @@ class SimulationOrchestrator:
         )
         if self.visual and isinstance(context, Live):
             self._live = context
-        with context:
-            self.display.add_event("Running AWS preflight check...")
-            self._refresh_state()
+        with context, self.logger:
+            render_task = asyncio.create_task(self._render_loop()) if self._live is not None else None
             try:
-                identity = await self.llm.preflight_check()
-                active_models = self._active_model_ids()
-                identity["active_models"] = active_models
-                identity["agent_models"] = {
-                    character.value: self._model_for_actor(character.value)
-                    for character in CHARACTER_ORDER
-                } | {"Referee": self._model_for_actor("Referee")}
-                self.display.add_event(
-                    "AWS ready: "
-                    f"{identity['arn']} | {identity['region']} | "
-                    f"default={identity['model_id']} | active={len(active_models)} model(s)"
-                )
-                self._record_event("preflight_ok", identity)
-                self._refresh_state()
-            except Exception as exc:  # noqa: BLE001
-                message = f"Preflight failed: {str(exc)}"
-                self.display.add_event(message)
-                self._record_event("preflight_failed", {"error": str(exc)})
-                self._refresh_state()
-                raise RuntimeError(message) from exc
+                return await self._play_game()
+            finally:
+                if render_task is not None:
+                    render_task.cancel()
+                    await asyncio.gather(render_task, return_exceptions=True)
+                    self._render_now()
+
+    async def _play_game(self) -> dict[str, Any]:
+        self.display.add_event("Running AWS preflight check...")
+        self._refresh_state()
+        try:
+            identity = await self.llm.preflight_check()
+            active_models = self._active_model_ids()
+            identity["active_models"] = active_models
+            identity["agent_models"] = dict(self._agent_models)
+            self.display.add_event(
+                "AWS ready: "
+                f"{identity['arn']} | {identity['region']} | "
+                f"default={identity['model_id']} | active={len(active_models)} model(s)"
+            )
+            self._record_event("preflight_ok", identity)
+            self._refresh_state()
+        except Exception as exc:  # noqa: BLE001
+            message = f"Preflight failed: {str(exc)}"
+            self.display.add_event(message)
+            self._record_event("preflight_failed", {"error": str(exc)})
+            self._refresh_state()
+            raise RuntimeError(message) from exc
 
-            while self.engine.state.phase != Phase.COMPLETE:
-                self.engine.start_round()
-                if self.engine.state.phase == Phase.COMPLETE:
-                    break
+        while self.engine.state.phase != Phase.COMPLETE:
+            self.engine.start_round()
+            if self.engine.state.phase == Phase.COMPLETE:
+                break
+            self._round_started_at = time.monotonic()
 
-                self._reset_round_usage()
-                self._record_event("round_started", {"round": self.engine.state.round_number})
-                self._refresh_state()
+            self._reset_round_usage()
+            self._record_event("round_started", {"round": self.engine.state.round_number})
+            self._refresh_state()
 
-                await self._run_negotiation_phase()
-                await self._referee_phase_change("negotiation", "voting")
-                self.engine.enter_voting_phase()
-                self._record_event("phase_change", {"phase": "voting"})
-                self._refresh_state()
+            await self._run_negotiation_phase()
+            await self._referee_phase_change("negotiation", "voting")
+            self.engine.enter_voting_phase()
+            self._record_event("phase_change", {"phase": "voting"})
+            self._refresh_state()
 
-                await self._run_voting_phase()
-                await self._referee_phase_change("voting", "resolution")
-                round_result = self.engine.resolve_round()
-                self._record_event(
-                    "round_resolved",
-                    {
-                        "passed_proposal": round_result.passed_proposal_index,
-                        "outcome": round_result.outcome_type.value if round_result.outcome_type else None,
-                        "winning_votes": round_result.winning_votes,
-                        "effect": round_result.applied_effect,
-                    },
-                )
-                self._refresh_state()
-                await self._referee_phase_change("resolution", "next_round")
-
-            scores = self.engine.score_players()
-            winners = [char.value for char, score in scores.items() if score >= self.config.win_threshold]
-            summary = {
-                "game_id": self.game_id,
-                "scores": {character.value: score for character, score in scores.items()},
-                "winners": winners,
-                "log_dir": self.logger.run_path(),
-            }
-            self._record_event("game_complete", summary)
-            self.display.add_event(f"Game complete. Winners: {winners if winners else 'None'}")
+            await self._run_voting_phase()
+            await self._referee_phase_change("voting", "resolution")
+            round_result = self.engine.resolve_round()
+            self._record_event(
+                "round_resolved",
+                {
+                    "passed_proposal": round_result.passed_proposal_index,
+                    "outcome": round_result.outcome_type.value if round_result.outcome_type else None,
+                    "winning_votes": round_result.winning_votes,
+                    "effect": round_result.applied_effect,
+                },
+            )
             self._refresh_state()
-            return summary
+            await self._referee_phase_change("resolution", "next_round")
+            self.logger.flush()
+
+        scores = self.engine.score_players()
+        winners = [char.value for char, score in scores.items() if score >= self.config.win_threshold]
+        summary = {
+            "game_id": self.game_id,
+            "scores": {character.value: score for character, score in scores.items()},
+            "winners": winners,
+            "log_dir": self.logger.run_path(),
+        }
+        self._record_event("game_complete", summary)
+        self.display.add_event(f"Game complete. Winners: {winners if winners else 'None'}")
+        self._refresh_state()
+        return summary
 
     async def _run_negotiation_phase(self) -> None:
         self.display.add_event("Negotiation phase started; agents are thinking...")
         self._refresh_state()
-        round_deadline = time.time() + self.config.round_timeout_seconds
+        round_deadline = time.monotonic() + self.config.round_timeout_seconds
         lock = asyncio.Lock()
         stop_event = asyncio.Event()
-        last_heartbeat = time.time()
-        last_progress_time = time.time()
+        last_heartbeat = time.monotonic()
+        last_progress_time = time.monotonic()
         forced_reason: str | None = None
+        # Public snapshot and transcript tail shared by every player until the next engine update.
+        shared_view: tuple[dict[str, Any], str] | None = None
 
         async def loop_player(character: Character) -> None:
-            nonlocal last_progress_time
+            nonlocal last_progress_time, shared_view
             agent = self.player_agents[character]
             no_action_streak = 0
             repeated_invalid_token = 0
             last_invalid_token: int | None = None
+            consecutive_failures = 0
             while not stop_event.is_set():
-                if time.time() >= round_deadline:
+                if time.monotonic() >= round_deadline:
                     stop_event.set()
                     return
 
-                async with lock:
-                    if self.engine.state.phase != Phase.NEGOTIATION:
-                        return
-                    state = self.engine.export_public_state()
-                    transcript_tail = self.engine.state.transcript[-20:]
-                    scratchpad_before = self.engine.state.scratchpads[character]
+                # No await between these reads, so they see one consistent state without the lock;
+                # only the commit section below needs it.
+                if self.engine.state.phase != Phase.NEGOTIATION:
+                    return
+                if shared_view is None:
+                    shared_view = (self.engine.export_public_state(), self._transcript_tail_text(20))
+                state, transcript_tail = shared_view
+                scratchpad_before = self.engine.state.scratchpads[character]
+                token_mask = self.engine.state.token_mask
 
                 try:
-                    result = await asyncio.wait_for(
-                        agent.negotiation_action(state, transcript_tail, scratchpad_before),
-                        timeout=self.config.llm_request_timeout_seconds,
+                    result = await self._llm_call(
+                        agent.negotiation_action(state, transcript_tail, scratchpad_before, token_mask),
+                        "negotiation",
                     )
                 except asyncio.TimeoutError:
                     self._record_event(
@@ -175,12 +268,14 @@ class SimulationOrchestrator:
                         {
                             "character": character.value,
                             "phase": "negotiation",
-                            "timeout_seconds": self.config.llm_request_timeout_seconds,
+                            "timeout_seconds": self._llm_timeouts["negotiation"],
                         },
                     )
                     self.display.add_event(f"{character.value} timed out in negotiation; retrying")
                     self._refresh_state()
-                    await asyncio.sleep(0.1)
+                    consecutive_failures += 1
+                    if not await self._negotiation_retry_backoff(character, consecutive_failures):
+                        return
                     continue
                 except Exception as exc:  # noqa: BLE001
                     self._record_event(
@@ -189,13 +284,17 @@ class SimulationOrchestrator:
                     )
                     self.display.add_event(f"{character.value} negotiation error: {str(exc)[:80]}")
                     self._refresh_state()
-                    await asyncio.sleep(0.1)
+                    consecutive_failures += 1
+                    if not await self._negotiation_retry_backoff(character, consecutive_failures):
+                        return
                     continue
+                consecutive_failures = 0
 
                 timestamp = time.time()
                 async with lock:
                     if stop_event.is_set() or self.engine.state.phase != Phase.NEGOTIATION:
                         return
+                    shared_view = None
 
                     self._log_llm_exchange("player", character, result, scratchpad_before)
                     self._record_parse_warning("player", character.value, "negotiation", result)
@@ -207,7 +306,7 @@ class SimulationOrchestrator:
                     control_action = str(result.get("_control_action", ""))
                     utterance = (result.get("utterance") or "").strip()
                     if utterance:
-                        binding_allowed = character not in self.engine.state.token_assignments.values()
+                        binding_allowed = character not in self.engine.state.token_assignments
                         was_muted = character in self.engine.state.muted_players
                         kept, muted = self.engine.record_utterance(character, utterance, binding_allowed)
                         if kept:
@@ -234,7 +333,7 @@ class SimulationOrchestrator:
                             },
                         )
                         if success:
-                            last_progress_time = time.time()
+                            last_progress_time = time.monotonic()
                             repeated_invalid_token = 0
                             last_invalid_token = None
                             self.display.add_event(f"{character.value} took token {attempt}")
@@ -259,7 +358,7 @@ class SimulationOrchestrator:
                                     },
                                 )
                                 if fallback_success:
-                                    last_progress_time = time.time()
+                                    last_progress_time = time.monotonic()
                                     repeated_invalid_token = 0
                                     last_invalid_token = None
                                     self.display.add_event(
@@ -289,8 +388,8 @@ class SimulationOrchestrator:
         tasks = [asyncio.create_task(loop_player(character)) for character in CHARACTER_ORDER]
 
         while not stop_event.is_set():
-            now = time.time()
-            if time.time() >= round_deadline:
+            now = time.monotonic()
+            if now >= round_deadline:
                 stop_event.set()
                 break
             if self.engine.all_tokens_taken():
@@ -313,11 +412,21 @@ class SimulationOrchestrator:
             if (now - last_heartbeat) >= 5:
                 remaining = max(0, int(round_deadline - now))
                 self.display.add_event(
-                    f"Negotiation active... tokens {len(self.engine.state.token_assignments)}/4, {remaining}s left"
+                    f"Negotiation active... tokens {self.engine.state.token_mask.bit_count()}/4, {remaining}s left"
                 )
                 self._refresh_state()
                 last_heartbeat = now
-            await asyncio.sleep(0.1)
+            # Players set stop_event on completion; otherwise sleep until the next deadline, deadlock or
+            # heartbeat check is due. Progress only pushes the deadlock check later, so a stale wakeup is harmless.
+            next_check = min(
+                round_deadline,
+                last_progress_time + self.config.negotiation_deadlock_seconds,
+                last_heartbeat + 5,
+            )
+            try:
+                await asyncio.wait_for(stop_event.wait(), timeout=max(0.0, next_check - time.monotonic()))
+            except asyncio.TimeoutError:
+                pass
 
         for task in tasks:
             task.cancel()
@@ -362,14 +471,14 @@ class SimulationOrchestrator:
 
             player = self.engine.state.token_assignments[token]
             snapshot = self.engine.export_public_state()
-            transcript_tail = self.engine.state.transcript[-20:]
+            transcript_tail = self._transcript_tail_text(20)
             scratchpad_before = self.engine.state.scratchpads[player]
 
             vote: int
             try:
-                result = await asyncio.wait_for(
+                result = await self._llm_call(
                     self.player_agents[player].voting_action(snapshot, transcript_tail, scratchpad_before, token),
-                    timeout=self.config.llm_request_timeout_seconds,
+                    "voting",
                 )
                 self._log_llm_exchange("player", player, result, scratchpad_before)
                 self._record_parse_warning("player", player.value, "voting", result)
@@ -390,7 +499,7 @@ class SimulationOrchestrator:
                     {
                         "character": player.value,
                         "phase": "voting",
-                        "timeout_seconds": self.config.llm_request_timeout_seconds,
+                        "timeout_seconds": self._llm_timeouts["voting"],
                         "action": "forfeit_vote",
                     },
                 )
@@ -421,15 +530,16 @@ class SimulationOrchestrator:
 
     async def _run_vote_change_window(self, target: Character) -> None:
         actors = [p for p in CHARACTER_ORDER if p != target]
+        # All actors in the window see the same public snapshot; build it once for the batch.
+        state = self.engine.export_public_state()
+        transcript_tail = self._transcript_tail_text(20)
 
         async def one_action(actor: Character) -> tuple[Character, dict[str, Any] | None, float]:
-            state = self.engine.export_public_state()
-            transcript_tail = self.engine.state.transcript[-20:]
             scratchpad_before = self.engine.state.scratchpads[actor]
             try:
-                result = await asyncio.wait_for(
+                result = await self._llm_call(
                     self.player_agents[actor].vote_change_action(state, transcript_tail, scratchpad_before, target),
-                    timeout=self.config.llm_request_timeout_seconds,
+                    "vote_change",
                 )
                 self._log_llm_exchange("player", actor, result, scratchpad_before)
                 self._record_parse_warning("player", actor.value, "voting_change_window", result)
@@ -443,7 +553,7 @@ class SimulationOrchestrator:
                     {
                         "character": actor.value,
                         "phase": "voting_change_window",
-                        "timeout_seconds": self.config.llm_request_timeout_seconds,
+                        "timeout_seconds": self._llm_timeouts["vote_change"],
                         "action": "forfeit_vote_change",
                     },
                 )
@@ -463,11 +573,10 @@ class SimulationOrchestrator:
                 return actor, None, time.time()
 
         tasks = [asyncio.create_task(one_action(actor)) for actor in actors]
-        ordered_results: list[tuple[Character, dict[str, Any] | None, float]] = []
+        # Apply each result as soon as it lands (same completion order as before), so fast
+        # responders show up while slower models are still thinking.
         for coro in asyncio.as_completed(tasks):
-            ordered_results.append(await coro)
-
-        for actor, result, ts in ordered_results:
+            actor, result, ts = await coro
             if not result:
                 continue
             utterance = (result.get("utterance") or "").strip()
@@ -512,7 +621,7 @@ class SimulationOrchestrator:
         self._refresh_state()
         referee_scratchpad_before = self._referee_scratchpad
         try:
-            result = await asyncio.wait_for(
+            result = await self._llm_call(
                 self.referee.evaluate_phase_change(
                     from_phase,
                     to_phase,
@@ -521,7 +630,7 @@ class SimulationOrchestrator:
                     contracts,
                     self._referee_scratchpad,
                 ),
-                timeout=self.config.llm_request_timeout_seconds,
+                "referee",
             )
             self._log_llm_exchange("referee", None, result, referee_scratchpad_before)
             self._record_parse_warning("referee", "Referee", f"{from_phase}->{to_phase}", result)
@@ -534,7 +643,7 @@ class SimulationOrchestrator:
                 {
                     "from": from_phase,
                     "to": to_phase,
-                    "timeout_seconds": self.config.llm_request_timeout_seconds,
+                    "timeout_seconds": self._llm_timeouts["referee"],
                 },
             )
             self.display.add_event(f"Referee timeout on {from_phase}->{to_phase}; continuing without new rulings")
@@ -560,17 +669,14 @@ class SimulationOrchestrator:
 
     def _parse_character(self, raw: str) -> Character:
         normalized = raw.strip().lower().replace("'", "")
-        mapping = {
-            "carmichael": Character.CARMICHAEL,
-            "quincy": Character.QUINCY,
-            "medici": Character.MEDICI,
-            "dambrosio": Character.DAMBROSIO,
-        }
-        if normalized not in mapping:
+        character = _CHARACTER_BY_KEY.get(normalized)
+        if character is None:
             raise ValueError(f"Unknown character: {raw}")
-        return mapping[normalized]
+        return character
 
     def _first_legal_token_for_player(self, player: Character) -> int | None:
+        if player in self.engine.state.token_assignments:
+            return None
         for token in (3, 4, 2, 1):
             if self.engine.can_take_token(player, token):
                 return token
@@ -590,6 +696,7 @@ class SimulationOrchestrator:
         if not cleaned:
             return []
 
+        # try_extract_json_object already looks inside ``` fences, so one parse covers both forms.
         parsed = try_extract_json_object(cleaned)
         if isinstance(parsed, dict):
             raw = parsed.get("rulings", [])
@@ -597,12 +704,6 @@ class SimulationOrchestrator:
                 return [self._clean_ruling_text(str(item)) for item in raw if str(item).strip()]
 
         de_fenced = self._strip_code_fence(cleaned)
-        parsed_fenced = try_extract_json_object(de_fenced)
-        if isinstance(parsed_fenced, dict):
-            raw_fenced = parsed_fenced.get("rulings", [])
-            if isinstance(raw_fenced, list):
-                return [self._clean_ruling_text(str(item)) for item in raw_fenced if str(item).strip()]
-
         if "\n" in de_fenced:
             parts = [self._clean_ruling_text(part) for part in de_fenced.splitlines() if part.strip()]
             if parts:
@@ -621,7 +722,7 @@ class SimulationOrchestrator:
         return "\n".join(lines).strip()
 
     def _clean_ruling_text(self, text: str) -> str:
-        normalized = " ".join(text.replace("`", "").split()).strip()
+        normalized = " ".join(text.translate(_STRIP_BACKTICKS).split())
         if len(normalized) <= 280:
             return normalized
         return f"{normalized[:277]}..."
@@ -652,15 +753,7 @@ class SimulationOrchestrator:
         if "committed to" not in cleaned.lower():
             return None
 
-        pattern = re.compile(
-            r"(?i)^(?:\d+[.)]\s*)?"
-            r"(Carmichael|Quincy|Medici|D'Ambrosio)\s+"
-            r"(?:made\s+)?(?:a\s+)?(?:binding\s+)?"
-            r"(?:commitment|commitments)?\s*"
-            r"(?:to:?\s*|committed to\s+)"
-            r"(.+)$"
-        )
-        match = pattern.search(cleaned)
+        match = _COMMITMENT_RE.search(cleaned)
         if not match:
             return None
 
@@ -676,9 +769,11 @@ class SimulationOrchestrator:
             return None
 
         normalized_text = f"{actor.value} committed to {clause}"
-        digest = hashlib.sha1(
-            f"{normalized_text.lower()}|{'|'.join(sorted(p.value for p in parties))}".encode("utf-8")
-        ).hexdigest()[:10]
+        # Content hash for de-duplication only; a 5-byte BLAKE2b digest keeps the 10-hex-char id length.
+        digest = hashlib.blake2b(
+            f"{normalized_text.lower()}|{'|'.join(sorted(p.value for p in parties))}".encode("utf-8"),
+            digest_size=5,
+        ).hexdigest()
         contract_id = f"inferred_{digest}"
         return Contract(
             contract_id=contract_id,
@@ -690,17 +785,7 @@ class SimulationOrchestrator:
 
     def _characters_mentioned(self, text: str) -> set[Character]:
         lowered = text.lower()
-        mentions: set[Character] = set()
-        aliases = {
-            Character.CARMICHAEL: ("carmichael",),
-            Character.QUINCY: ("quincy",),
-            Character.MEDICI: ("medici",),
-            Character.DAMBROSIO: ("d'ambrosio", "dambrosio"),
-        }
-        for character, names in aliases.items():
-            if any(name in lowered for name in names):
-                mentions.add(character)
-        return mentions
+        return {character for alias, character in _CHARACTER_ALIASES if alias in lowered}
 
     def _apply_inferred_referee_enforcement_from_rulings(
         self,
@@ -711,22 +796,14 @@ class SimulationOrchestrator:
         if from_phase != "voting" or to_phase != "resolution":
             return
 
-        keywords = ("final vote state", "authoritative", "binding final vote", "final vote position")
-        pattern = re.compile(
-            r"(?i)\b(?:set|shift(?:ed)?|redirect(?:ed)?)\s+"
-            r"(Carmichael|Quincy|Medici|D'Ambrosio)\s+"
-            r"(?:to|toward)\s+proposal\s*([01])"
-        )
-        fallback_pattern = re.compile(
-            r"(?i)\b(Carmichael|Quincy|Medici|D'Ambrosio)\b.{0,50}\bproposal\s*([01])\b"
-        )
-
         applied_any = False
         for line in rulings:
             lowered = line.lower()
-            if not any(key in lowered for key in keywords):
+            if _ENFORCEMENT_STEMS[0] not in lowered and _ENFORCEMENT_STEMS[1] not in lowered:
+                continue
+            if not any(key in lowered for key in _ENFORCEMENT_KEYWORDS):
                 continue
-            match = pattern.search(line) or fallback_pattern.search(line)
+            match = _ENFORCED_VOTE_RE.search(line) or _ENFORCED_VOTE_FALLBACK_RE.search(line)
             if not match:
                 continue
             player = self._parse_character(match.group(1))
@@ -776,39 +853,91 @@ class SimulationOrchestrator:
         result: dict[str, Any],
         scratchpad_before: str | None,
     ) -> None:
-        scratchpad_after = result.get("scratchpad") if isinstance(result, dict) else None
-        self.logger.log_llm(
-            role=role,
-            player=character.value if character else "Referee",
-            prompt=result.get("_prompt", {}),
-            response_text=result.get("_raw_text", ""),
-            raw_response=result.get("_raw_response", {}),
-            metadata={
-                "attempts": result.get("_attempts", 0),
-                "scratchpad_before": scratchpad_before,
-                "scratchpad_after": scratchpad_after,
-            },
-        )
+        if self.logger.records_llm:
+            scratchpad_after = result.get("scratchpad") if isinstance(result, dict) else None
+            self.logger.log_llm(
+                role=role,
+                player=character.value if character else "Referee",
+                prompt=result.get("_prompt", {}),
+                response_text=result.get("_raw_text", ""),
+                raw_response=result.get("_raw_response"),
+                metadata={
+                    "attempts": result.get("_attempts", 0),
+                    "scratchpad_before": scratchpad_before,
+                    "scratchpad_after": scratchpad_after,
+                },
+            )
         actor_name = character.value if character else "Referee"
-        usage = self._extract_usage_from_raw_response(result.get("_raw_response"))
+        if "_usage" in result:
+            usage = self._usage_bucket_from(result.get("_usage"))
+        else:
+            usage = self._extract_usage_from_raw_response(result.get("_raw_response"))
         self._accumulate_usage(actor_name, usage)
 
     def _refresh_state(self) -> None:
+        # Only marks the view stale; _render_loop repaints at most once per Live refresh tick.
+        self._render_dirty = True
+
+    def _render_now(self) -> None:
+        self._render_dirty = False
         state = self.engine.export_public_state()
-        state["scratchpads_view"] = {
-            character.value: self.engine.state.scratchpads.get(character, "")
-            for character in CHARACTER_ORDER
-        } | {"Referee": self._referee_scratchpad}
+        view = self._scratchpads_view
+        scratchpads = self.engine.state.scratchpads
+        for character in CHARACTER_ORDER:
+            view[character.value] = scratchpads.get(character, "")
+        view["Referee"] = self._referee_scratchpad
+        state["scratchpads_view"] = view
         state["llm_usage"] = self._usage_snapshot()
         self.display.set_state(state)
         if self._live is not None:
             self._live.update(self.display.render())
 
+    async def _render_loop(self) -> None:
+        while True:
+            if self._render_dirty:
+                self._render_now()
+            await asyncio.sleep(_RENDER_INTERVAL_SECONDS)
+
+    async def _negotiation_retry_backoff(self, character: Character, failures: int) -> bool:
+        if failures > self.config.agent_max_retries:
+            self._record_event(
+                "agent_retries_exhausted",
+                {"character": character.value, "phase": "negotiation", "failures": failures},
+            )
+            self.display.add_event(f"{character.value} stopped negotiating after {failures} failed calls")
+            self._refresh_state()
+            return False
+        # Jitter uses the module RNG so retries do not shift the seeded game RNG.
+        delay = min(5.0, 0.2 * 2 ** (failures - 1)) * random.uniform(0.5, 1.5)
+        await asyncio.sleep(delay)
+        return True
+
+    async def _llm_call(self, coro: Coroutine[Any, Any, dict[str, Any]], operation: str) -> dict[str, Any]:
+        # The per-request timeout starts once a slot is free, so queueing is not a timeout.
+        try:
+            await self._llm_semaphore.acquire()
+        except BaseException:
+            coro.close()
+            raise
+        try:
+            return await asyncio.wait_for(coro, timeout=self._llm_timeouts[operation])
+        finally:
+            self._llm_semaphore.release()
+
+    def _transcript_tail_text(self, limit: int) -> str:
+        # The transcript is append-only, so its length identifies the tail until the next line.
+        transcript = self.engine.state.transcript
+        key = (len(transcript), limit)
+        cached_key, cached_text = self._transcript_tail_cache
+        if cached_key != key:
+            cached_text = "\n".join(transcript[-limit:])
+            self._transcript_tail_cache = (key, cached_text)
+        return cached_text
+
     def _round_timed_out(self) -> bool:
-        started_at = float(self.engine.state.metadata.get("round_started_at") or 0.0)
-        if started_at <= 0:
+        if self._round_started_at is None:
             return False
-        return (time.time() - started_at) >= self.config.round_timeout_seconds
+        return (time.monotonic() - self._round_started_at) >= self.config.round_timeout_seconds
 
     def _record_parse_warning(self, role: str, actor: str, phase: str, result: dict[str, Any]) -> None:
         warning = result.get("_parse_warning")
@@ -875,62 +1004,51 @@ class SimulationOrchestrator:
     def _client_for_model(self, model_id: str) -> BedrockConverseClient:
         if model_id in self._llm_clients_by_model:
             return self._llm_clients_by_model[model_id]
-        cfg = self.config if model_id == self.config.model_id else replace(self.config, model_id=model_id)
-        client = BedrockConverseClient(cfg)
+        if model_id == self.config.model_id:
+            client = BedrockConverseClient(self.config)
+        else:
+            default_client = self._client_for_model(self.config.model_id)
+            client = BedrockConverseClient(replace(self.config, model_id=model_id), runtime_client=default_client.client)
         self._llm_clients_by_model[model_id] = client
         return client
 
     def _active_model_ids(self) -> list[str]:
-        models = {
-            self.config.model_id,
-            self._model_for_actor("Referee"),
-            *(self._model_for_actor(character.value) for character in CHARACTER_ORDER),
-        }
-        return sorted(models)
-
-    def _new_usage_bucket(self) -> dict[str, int]:
-        return {
-            "input_tokens": 0,
-            "output_tokens": 0,
-            "total_tokens": 0,
-            "cache_read_tokens": 0,
-            "cache_write_tokens": 0,
-        }
+        return sorted({self.config.model_id, *self._agent_models.values()})
 
     def _reset_round_usage(self) -> None:
-        self._usage_round = self._new_usage_bucket()
+        self._usage_round = UsageBucket()
         self._usage_requests_round = 0
         self._usage_requests_by_actor_round = {name: 0 for name in self._usage_actor_order}
-        self._usage_by_actor_round = {name: self._new_usage_bucket() for name in self._usage_actor_order}
+        self._usage_by_actor_round = {name: UsageBucket() for name in self._usage_actor_order}
 
-    def _extract_usage_from_raw_response(self, raw_response: Any) -> dict[str, int]:
+    def _extract_usage_from_raw_response(self, raw_response: Any) -> UsageBucket:
         if not isinstance(raw_response, dict):
-            return self._new_usage_bucket()
-        usage = raw_response.get("usage", {})
+            return UsageBucket()
+        return self._usage_bucket_from(raw_response.get("usage"))
+
+    def _usage_bucket_from(self, usage: Any) -> UsageBucket:
         if not isinstance(usage, dict):
-            return self._new_usage_bucket()
-        return {
-            "input_tokens": int(usage.get("inputTokens") or 0),
-            "output_tokens": int(usage.get("outputTokens") or 0),
-            "total_tokens": int(usage.get("totalTokens") or 0),
-            "cache_read_tokens": int(usage.get("cacheReadInputTokens") or 0),
-            "cache_write_tokens": int(usage.get("cacheWriteInputTokens") or 0),
-        }
+            return UsageBucket()
+        return UsageBucket(
+            input_tokens=max(0, int(usage.get("inputTokens") or 0)),
+            output_tokens=max(0, int(usage.get("outputTokens") or 0)),
+            total_tokens=max(0, int(usage.get("totalTokens") or 0)),
+            cache_read_tokens=max(0, int(usage.get("cacheReadInputTokens") or 0)),
+            cache_write_tokens=max(0, int(usage.get("cacheWriteInputTokens") or 0)),
+        )
 
-    def _accumulate_usage(self, actor: str, usage: dict[str, int]) -> None:
+    def _accumulate_usage(self, actor: str, usage: UsageBucket) -> None:
         if actor not in self._usage_by_actor_total:
             self._usage_actor_order.append(actor)
-            self._usage_by_actor_total[actor] = self._new_usage_bucket()
-            self._usage_by_actor_round[actor] = self._new_usage_bucket()
+            self._usage_by_actor_total[actor] = UsageBucket()
+            self._usage_by_actor_round[actor] = UsageBucket()
             self._usage_requests_by_actor_total[actor] = 0
             self._usage_requests_by_actor_round[actor] = 0
 
-        for key in self._usage_totals:
-            value = max(0, int(usage.get(key, 0)))
-            self._usage_totals[key] += value
-            self._usage_round[key] += value
-            self._usage_by_actor_total[actor][key] += value
-            self._usage_by_actor_round[actor][key] += value
+        self._usage_totals.add(usage)
+        self._usage_round.add(usage)
+        self._usage_by_actor_total[actor].add(usage)
+        self._usage_by_actor_round[actor].add(usage)
 
         self._usage_requests_total += 1
         self._usage_requests_round += 1
@@ -941,10 +1059,10 @@ class SimulationOrchestrator:
         return {
             "requests_total": self._usage_requests_total,
             "requests_round": self._usage_requests_round,
-            "tokens_total": dict(self._usage_totals),
-            "tokens_round": dict(self._usage_round),
-            "by_actor_total": {name: dict(self._usage_by_actor_total[name]) for name in self._usage_actor_order},
-            "by_actor_round": {name: dict(self._usage_by_actor_round[name]) for name in self._usage_actor_order},
+            "tokens_total": asdict(self._usage_totals),
+            "tokens_round": asdict(self._usage_round),
+            "by_actor_total": {name: asdict(self._usage_by_actor_total[name]) for name in self._usage_actor_order},
+            "by_actor_round": {name: asdict(self._usage_by_actor_round[name]) for name in self._usage_actor_order},
             "requests_by_actor_total": dict(self._usage_requests_by_actor_total),
             "requests_by_actor_round": dict(self._usage_requests_by_actor_round),
         }
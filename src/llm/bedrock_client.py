@@ -1,15 +1,28 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import json
+import os
+import random
+import time
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Any
 
 import boto3
+from botocore.config import Config as BotoConfig
 from botocore.exceptions import ClientError, NoCredentialsError
 
 from src.config.settings import SimulationConfig
 
 
+_CACHE_POINT: dict[str, Any] = {"cachePoint": {"type": "default"}}
+_PREFLIGHT_CACHE_DIR = Path.home() / ".cache" / "ratscramble"
+# botocore's default connection pool size.
+_MIN_POOL_CONNECTIONS = 10
+
+
 @dataclass
 class LLMResult:
     text: str
@@ -20,11 +33,18 @@ class LLMResult:
 
 
 class BedrockConverseClient:
-    def __init__(self, config: SimulationConfig):
+    def __init__(self, config: SimulationConfig, runtime_client: Any | None = None):
         self.config = config
-        session = boto3.Session(profile_name=config.aws_profile) if config.aws_profile else boto3.Session()
-        self.client = session.client("bedrock-runtime", region_name=config.region)
-        self.sts = session.client("sts", region_name=config.region)
+        # The model ID travels in each request, so clients for other models can share one
+        # bedrock-runtime client (and its credential chain and connection pool).
+        self.client = runtime_client if runtime_client is not None else self._session().client(
+            "bedrock-runtime",
+            region_name=config.region,
+            # Every in-flight call (up to llm_max_parallel) needs its own pooled connection.
+            config=BotoConfig(max_pool_connections=max(_MIN_POOL_CONNECTIONS, config.llm_max_parallel)),
+        )
+        self.sts: Any | None = None
+        self._tool_configs: dict[tuple[int, str], tuple[list[dict[str, Any]], dict[str, Any]]] = {}
 
     async def converse(
         self,
@@ -34,30 +54,16 @@ class BedrockConverseClient:
         temperature: float | None = None,
         max_tokens: int | None = None,
     ) -> LLMResult:
-        retries = self.config.request_retries
-        backoff = self.config.request_retry_backoff_seconds
-        last_exc: Exception | None = None
-
-        for attempt in range(retries + 1):
-            try:
-                payload = {
-                    "modelId": self.config.model_id,
-                    "system": [{"text": system_prompt}],
-                    "messages": [{"role": "user", "content": [{"text": user_prompt}]}],
-                    "inferenceConfig": {
-                        "temperature": self.config.temperature if temperature is None else temperature,
-                        "maxTokens": self.config.max_tokens if max_tokens is None else max_tokens,
-                    },
-                }
-                return await self._invoke_with_retries(payload, attempt)
-            except Exception as exc:  # noqa: BLE001
-                last_exc = exc
-                if attempt >= retries:
-                    break
-                wait_seconds = backoff[min(attempt, len(backoff) - 1)]
-                await asyncio.sleep(wait_seconds)
-        readable = self._format_exception(last_exc)
-        raise RuntimeError(f"Bedrock converse failed after {retries + 1} attempts: {readable}")
+        payload = {
+            "modelId": self.config.model_id,
+            "system": [{"text": system_prompt}],
+            "messages": [{"role": "user", "content": [{"text": user_prompt}]}],
+            "inferenceConfig": {
+                "temperature": self.config.temperature if temperature is None else temperature,
+                "maxTokens": self.config.max_tokens if max_tokens is None else max_tokens,
+            },
+        }
+        return await self._converse_with_retries(payload, "Bedrock converse")
 
     async def converse_with_tools(
         self,
@@ -69,45 +75,88 @@ class BedrockConverseClient:
         temperature: float | None = None,
         max_tokens: int | None = None,
     ) -> LLMResult:
+        payload = {
+            "modelId": self.config.model_id,
+            "system": self._cached_blocks([{"text": system_prompt}]),
+            "messages": [{"role": "user", "content": [{"text": user_prompt}]}],
+            "inferenceConfig": {
+                "temperature": self.config.temperature if temperature is None else temperature,
+                "maxTokens": self.config.max_tokens if max_tokens is None else max_tokens,
+            },
+            "toolConfig": self._tool_config(tools, tool_choice),
+        }
+        return await self._converse_with_retries(payload, "Bedrock converse (tools)")
+
+    async def preflight_check(self) -> dict[str, str]:
+        cache_path = self._preflight_cache_path()
+        identity = self._read_preflight_cache(cache_path) if cache_path else None
+        if identity is None:
+            if self.sts is None:
+                self.sts = self._session().client("sts", region_name=self.config.region)
+            response = await asyncio.to_thread(self.sts.get_caller_identity)
+            identity = {
+                "account": str(response.get("Account", "")),
+                "arn": str(response.get("Arn", "")),
+            }
+            if cache_path:
+                self._write_preflight_cache(cache_path, identity)
+        return {
+            **identity,
+            "region": self.config.region,
+            "model_id": self.config.model_id,
+        }
+
+    def _session(self) -> boto3.Session:
+        return boto3.Session(profile_name=self.config.aws_profile) if self.config.aws_profile else boto3.Session()
+
+    def _preflight_cache_path(self) -> Path | None:
+        if self.config.preflight_cache_ttl_seconds <= 0:
+            return None
+        profile = self.config.aws_profile or os.environ.get("AWS_PROFILE", "")
+        key = json.dumps({"region": self.config.region, "profile": profile}, sort_keys=True)
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+        return _PREFLIGHT_CACHE_DIR / f"preflight-{digest}.json"
+
+    def _read_preflight_cache(self, path: Path) -> dict[str, str] | None:
+        try:
+            if time.time() - path.stat().st_mtime > self.config.preflight_cache_ttl_seconds:
+                return None
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(data, dict) or not data.get("arn"):
+            return None
+        return {"account": str(data.get("account", "")), "arn": str(data["arn"])}
+
+    def _write_preflight_cache(self, path: Path, identity: dict[str, str]) -> None:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(identity), encoding="utf-8")
+            os.replace(tmp_path, path)
+        except OSError:
+            # The cache is best-effort; a read-only home just means no reuse.
+            pass
+
+    async def _converse_with_retries(self, payload: dict[str, Any], label: str) -> LLMResult:
         retries = self.config.request_retries
         backoff = self.config.request_retry_backoff_seconds
         last_exc: Exception | None = None
 
         for attempt in range(retries + 1):
             try:
-                payload = {
-                    "modelId": self.config.model_id,
-                    "system": [{"text": system_prompt}],
-                    "messages": [{"role": "user", "content": [{"text": user_prompt}]}],
-                    "inferenceConfig": {
-                        "temperature": self.config.temperature if temperature is None else temperature,
-                        "maxTokens": self.config.max_tokens if max_tokens is None else max_tokens,
-                    },
-                    "toolConfig": {
-                        "tools": tools,
-                        "toolChoice": self._tool_choice_payload(tool_choice),
-                    },
-                }
-                return await self._invoke_with_retries(payload, attempt)
+                return await self._invoke(payload, attempt)
             except Exception as exc:  # noqa: BLE001
                 last_exc = exc
                 if attempt >= retries:
                     break
-                wait_seconds = backoff[min(attempt, len(backoff) - 1)]
+                # Jittered so agents that failed together do not retry in lockstep.
+                wait_seconds = backoff[min(attempt, len(backoff) - 1)] * random.uniform(0.8, 1.2)
                 await asyncio.sleep(wait_seconds)
         readable = self._format_exception(last_exc)
-        raise RuntimeError(f"Bedrock converse (tools) failed after {retries + 1} attempts: {readable}")
+        raise RuntimeError(f"{label} failed after {retries + 1} attempts: {readable}")
 
-    async def preflight_check(self) -> dict[str, str]:
-        identity = await asyncio.to_thread(self.sts.get_caller_identity)
-        return {
-            "account": str(identity.get("Account", "")),
-            "arn": str(identity.get("Arn", "")),
-            "region": self.config.region,
-            "model_id": self.config.model_id,
-        }
-
-    async def _invoke_with_retries(self, payload: dict[str, Any], attempt: int) -> LLMResult:
+    async def _invoke(self, payload: dict[str, Any], attempt: int) -> LLMResult:
         response = await asyncio.to_thread(self.client.converse, **payload)
         text_chunks: list[str] = []
         tool_calls: list[dict[str, Any]] = []
@@ -120,7 +169,7 @@ class BedrockConverseClient:
                 tool_calls.append(
                     {
                         "tool_use_id": str(tool_use.get("toolUseId", "")),
-                        "name": str(tool_use.get("name", "")),
+                        "name": str(tool_use.get("name", "")).strip(),
                         "input": tool_use.get("input", {}),
                     }
                 )
@@ -132,6 +181,25 @@ class BedrockConverseClient:
             tool_calls=tool_calls,
         )
 
+    def _cached_blocks(self, blocks: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        # A trailing cache point lets Bedrock reuse the prefill for the invariant prefix.
+        if not self.config.prompt_cache_enabled:
+            return blocks
+        return [*blocks, _CACHE_POINT]
+
+    def _tool_config(self, tools: list[dict[str, Any]], tool_choice: str) -> dict[str, Any]:
+        # Tool sets are module-level constants, so build each toolConfig once and reuse it.
+        key = (id(tools), tool_choice)
+        cached = self._tool_configs.get(key)
+        if cached is not None and cached[0] is tools:
+            return cached[1]
+        tool_config = {
+            "tools": self._cached_blocks(tools),
+            "toolChoice": self._tool_choice_payload(tool_choice),
+        }
+        self._tool_configs[key] = (tools, tool_config)
+        return tool_config
+
     def _tool_choice_payload(self, choice: str) -> dict[str, Any]:
         if choice == "auto":
             return {"auto": {}}
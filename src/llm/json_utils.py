@@ -3,11 +3,14 @@ from __future__ import annotations
 import ast
 import json
 import re
+from collections.abc import Iterator
 from typing import Any
 
 
 _JSON_OBJECT_RE = re.compile(r"\{.*\}", re.DOTALL)
 _FENCED_JSON_RE = re.compile(r"```(?:json)?\s*(\{.*\})\s*```", re.DOTALL | re.IGNORECASE)
+# Characters that can change brace depth or string state; everything else is skipped in C.
+_BRACE_SCAN_RE = re.compile(r"[{}\"'\\]")
 
 
 def extract_json_object(text: str) -> dict[str, Any]:
@@ -19,20 +22,29 @@ def extract_json_object(text: str) -> dict[str, Any]:
 
 def try_extract_json_object(text: str) -> dict[str, Any] | None:
     text = text.strip()
-    try:
-        value = json.loads(text)
-        if isinstance(value, dict):
-            return value
-    except json.JSONDecodeError:
-        pass
+    # Only text that opens with a brace can parse to a dict; skip the failing parse on prose.
+    if text.startswith("{"):
+        try:
+            value = json.loads(text)
+            if isinstance(value, dict):
+                return value
+        except json.JSONDecodeError:
+            pass
+
+    if "```" in text:
+        fenced_match = _FENCED_JSON_RE.search(text)
+        if fenced_match:
+            candidate = fenced_match.group(1)
+            parsed = _parse_dict_like(candidate)
+            if parsed is not None:
+                return parsed
 
-    fenced_match = _FENCED_JSON_RE.search(text)
-    if fenced_match:
-        candidate = fenced_match.group(1)
+    for candidate in _balanced_objects(text):
         parsed = _parse_dict_like(candidate)
         if parsed is not None:
             return parsed
 
+    # Last resort for text whose braces do not balance, e.g. stray quotes inside the object.
     match = _JSON_OBJECT_RE.search(text)
     if match:
         parsed = _parse_dict_like(match.group(0))
@@ -42,6 +54,39 @@ def try_extract_json_object(text: str) -> dict[str, Any] | None:
     return None
 
 
+def _balanced_objects(text: str) -> Iterator[str]:
+    """Yield each top-level balanced ``{...}`` span, ignoring braces inside quoted strings."""
+    start = text.find("{")
+    while start != -1:
+        depth = 0
+        quote: str | None = None
+        escaped_at = -1
+        end = -1
+        for match in _BRACE_SCAN_RE.finditer(text, start):
+            char = match.group()
+            if match.start() == escaped_at:
+                continue
+            if char == "\\":
+                if quote is not None:
+                    escaped_at = match.end()
+            elif quote is not None:
+                if char == quote:
+                    quote = None
+            elif char in "\"'":
+                quote = char
+            elif char == "{":
+                depth += 1
+            else:
+                depth -= 1
+                if depth == 0:
+                    end = match.end()
+                    break
+        if end == -1:
+            return
+        yield text[start:end]
+        start = text.find("{", end)
+
+
 def _parse_dict_like(candidate: str) -> dict[str, Any] | None:
     try:
         value = json.loads(candidate)
@@ -1,12 +1,21 @@
 from __future__ import annotations
 
-import json
 import threading
+import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+import orjson
+
+
+# Buffered lines are written out once this many are pending or this much time has passed.
+_FLUSH_MAX_LINES = 64
+_FLUSH_MAX_SECONDS = 1.0
+# Event payloads carry int-keyed maps such as token assignments.
+_JSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
 
 @dataclass
 class GameLogger:
@@ -14,6 +23,9 @@ class GameLogger:
     game_id: str
     run_dir: Path = field(init=False)
 
+    # Whether log_llm writes anything; callers skip building LLM records when False.
+    records_llm = True
+
     def __post_init__(self) -> None:
         ts = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
         self.run_dir = Path(self.root) / f"{ts}_{self.game_id}"
@@ -22,12 +34,23 @@ class GameLogger:
         self._llm_path = self.run_dir / "raw_llm.jsonl"
         self._transcript_path = self.run_dir / "transcript.md"
         self._lock = threading.Lock()
+        self._pending: dict[Path, list[bytes]] = {}
+        self._pending_lines = 0
+        self._last_flush = time.monotonic()
+        # (epoch ms, ISO string) of the last timestamp; records within the same millisecond share it.
+        self._last_ts: tuple[int, str] = (-1, "")
+
+    def __enter__(self) -> GameLogger:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.flush()
 
     def log_event(self, event_type: str, round_number: int, phase: str, payload: dict[str, Any]) -> None:
         self._write_jsonl(
             self._events_path,
             {
-                "ts": datetime.now(timezone.utc).isoformat(),
+                "ts": self._now_iso(),
                 "type": event_type,
                 "round": round_number,
                 "phase": phase,
@@ -47,7 +70,7 @@ class GameLogger:
         self._write_jsonl(
             self._llm_path,
             {
-                "ts": datetime.now(timezone.utc).isoformat(),
+                "ts": self._now_iso(),
                 "role": role,
                 "player": player,
                 "prompt": prompt,
@@ -58,14 +81,58 @@ class GameLogger:
         )
 
     def log_transcript_line(self, line: str) -> None:
+        self._append(self._transcript_path, f"- {line}\n".encode("utf-8"))
+
+    def flush(self) -> None:
         with self._lock:
-            with self._transcript_path.open("a", encoding="utf-8") as handle:
-                handle.write(f"- {line}\n")
+            self._flush_locked()
+
+    def _now_iso(self) -> str:
+        ms = time.time_ns() // 1_000_000
+        last_ms, last_iso = self._last_ts
+        if ms != last_ms:
+            last_iso = datetime.fromtimestamp(ms / 1000, tz=timezone.utc).isoformat(timespec="milliseconds")
+            self._last_ts = (ms, last_iso)
+        return last_iso
 
     def _write_jsonl(self, path: Path, obj: dict[str, Any]) -> None:
+        self._append(path, orjson.dumps(obj, option=_JSON_OPTIONS) + b"\n")
+
+    def _append(self, path: Path, data: bytes) -> None:
         with self._lock:
-            with path.open("a", encoding="utf-8") as handle:
-                handle.write(json.dumps(obj, ensure_ascii=False) + "\n")
+            self._pending.setdefault(path, []).append(data)
+            self._pending_lines += 1
+            if (
+                self._pending_lines >= _FLUSH_MAX_LINES
+                or time.monotonic() - self._last_flush >= _FLUSH_MAX_SECONDS
+            ):
+                self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        # One open and write per file for the whole batch instead of one per record.
+        for path, chunks in self._pending.items():
+            with path.open("ab") as handle:
+                handle.write(b"".join(chunks))
+        self._pending.clear()
+        self._pending_lines = 0
+        self._last_flush = time.monotonic()
 
     def run_path(self) -> str:
         return str(self.run_dir)
+
+
+class SummaryGameLogger(GameLogger):
+    """Keeps only round results and the final summary; for batch simulations."""
+
+    records_llm = False
+    _KEPT_EVENTS = frozenset({"round_resolved", "game_complete"})
+
+    def log_event(self, event_type: str, round_number: int, phase: str, payload: dict[str, Any]) -> None:
+        if event_type in self._KEPT_EVENTS:
+            super().log_event(event_type, round_number, phase, payload)
+
+    def log_llm(self, *args: Any, **kwargs: Any) -> None:
+        return None
+
+    def log_transcript_line(self, line: str) -> None:
+        return None
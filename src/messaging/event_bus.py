@@ -4,14 +4,30 @@ import asyncio
 from collections.abc import AsyncIterator
 from typing import Any
 
+# Per-subscriber backlog; a subscriber that falls further behind loses its oldest events.
+_SUBSCRIBER_BACKLOG = 1024
+
 
 class EventBus:
     def __init__(self) -> None:
-        self._queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
+        self._subscribers: list[asyncio.Queue[dict[str, Any]]] = []
+
+    def publish(self, event: dict[str, Any]) -> None:
+        # Every subscriber gets its own copy of the stream; with none registered this is a no-op.
+        for queue in self._subscribers:
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(event)
 
-    async def publish(self, event: dict[str, Any]) -> None:
-        await self._queue.put(event)
+    def subscribe(self) -> AsyncIterator[dict[str, Any]]:
+        # Registered eagerly so events published before the first iteration are not missed.
+        queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue(maxsize=_SUBSCRIBER_BACKLOG)
+        self._subscribers.append(queue)
+        return self._drain(queue)
 
-    async def subscribe(self) -> AsyncIterator[dict[str, Any]]:
-        while True:
-            yield await self._queue.get()
+    async def _drain(self, queue: asyncio.Queue[dict[str, Any]]) -> AsyncIterator[dict[str, Any]]:
+        try:
+            while True:
+                yield await queue.get()
+        finally:
+            self._subscribers.remove(queue)
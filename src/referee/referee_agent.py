@@ -8,6 +8,8 @@ from src.agents.base_agent import BaseAgent
 
 @dataclass
 class RefereeAgent(BaseAgent):
+    include_raw: bool = False
+
     async def evaluate_phase_change(
         self,
         from_phase: str,
@@ -60,7 +62,9 @@ Guidance:
         data["scratchpad"] = next_scratchpad
         data["_prompt"] = {"system": system_prompt, "user": user_prompt}
         data["_raw_text"] = result.text
-        data["_raw_response"] = result.raw_response
+        data["_usage"] = result.raw_response.get("usage") if isinstance(result.raw_response, dict) else None
+        if self.include_raw:
+            data["_raw_response"] = result.raw_response
         data["_attempts"] = result.attempts
         return data
 
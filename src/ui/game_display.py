@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import re
+from collections import deque
+from collections.abc import Callable
+from itertools import islice
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -23,6 +27,8 @@ CHARACTER_STYLES: dict[str, str] = {
     "D'Ambrosio": "blue",
     "Referee": "bright_cyan",
 }
+# Every styled name in one alternation, so a line is scanned once rather than once per name.
+_CHARACTER_NAME_RE = re.compile("|".join(re.escape(name) for name in CHARACTER_STYLES))
 CHARACTER_ORDER: tuple[str, ...] = ("Carmichael", "Quincy", "Medici", "D'Ambrosio")
 SENDER_EMOJI: dict[str, str] = {
     "Carmichael": "🤖",
@@ -35,14 +41,40 @@ TOKEN_DOT = "●"
 EVENT_PREFIX = "__EVENT__::"
 
 
+def _token_legend() -> Text:
+    legend = Text("Legend: ")
+    for owner in CHARACTER_ORDER:
+        legend.append(TOKEN_DOT, style=CHARACTER_STYLES.get(owner, "white"))
+        legend.append(f" {owner}  ")
+    return legend
+
+
+# Static; Text.append copies its argument's content, so the constant itself is never mutated.
+_TOKEN_LEGEND = _token_legend()
+
+
 class _TailViewport:
     def __init__(self, renderable: Any):
         self.renderable = renderable
 
     def __rich_console__(self, console: Console, options: ConsoleOptions) -> RenderResult:
-        lines = console.render_lines(self.renderable, options, pad=False)
-        if options.height is not None and options.height > 0:
-            lines = lines[-options.height :]
+        height = options.height
+        if height is None or height <= 0:
+            lines = console.render_lines(self.renderable, options, pad=False)
+        else:
+            # Render chunks newest-first without the height cap (render_lines would keep the *top*
+            # rows) and stop once the viewport is full, so hidden history is never rendered.
+            unbounded = options.reset_height()
+            renderables = self.renderable.renderables if isinstance(self.renderable, Group) else [self.renderable]
+            chunks: list[list[list[Segment]]] = []
+            collected = 0
+            for renderable in reversed(renderables):
+                chunk = console.render_lines(renderable, unbounded, pad=False)
+                chunks.append(chunk)
+                collected += len(chunk)
+                if collected >= height:
+                    break
+            lines = [line for chunk in reversed(chunks) for line in chunk][-height:]
 
         for line in lines:
             yield from line
@@ -71,70 +103,143 @@ PROPOSAL_TYPES: dict[str, str] = {
     "Summer in Glory": "upset",
 }
 
-PROPOSAL_PATTERNS: dict[str, tuple[str, str]] = {
+SEASON_EMOJI: dict[str, str] = {
+    "spring": "🌱",
+    "summer": "☀️",
+    "autumn": "🍂",
+    "winter": "❄️",
+}
+
+# (type, majority pattern, consensus pattern) per proposal card, for one lookup per rendered proposal.
+PROPOSAL_INFO: dict[str, tuple[str, str, str]] = {
     card.name: (
-        " ".join(
-            {
-                "spring": "🌱",
-                "summer": "☀️",
-                "autumn": "🍂",
-                "winter": "❄️",
-            }.get(season.value, "?")
-            for season in card.majority
-        ),
-        " ".join(
-            {
-                "spring": "🌱",
-                "summer": "☀️",
-                "autumn": "🍂",
-                "winter": "❄️",
-            }.get(season.value, "?")
-            for season in card.consensus
-        ),
+        PROPOSAL_TYPES.get(card.name, "unknown"),
+        " ".join(SEASON_EMOJI.get(season.value, "?") for season in card.majority),
+        " ".join(SEASON_EMOJI.get(season.value, "?") for season in card.consensus),
     )
     for card in PROPOSAL_CARDS
 }
+_UNKNOWN_PROPOSAL = ("unknown", "---", "----")
+
+
+def _as_dict(value: Any) -> dict[Any, Any]:
+    return value if isinstance(value, dict) else {}
+
+
+@dataclass(slots=True)
+class _StateView:
+    """Snapshot fields coerced to the shapes the state views expect, built once per set_state."""
+
+    round_number: Any
+    phase: str
+    proposals: list[Any]
+    effects: dict[int, dict[str, Any]]
+    votes: dict[str, Any]
+    assignments: dict[str, int]
+    vote_changes: dict[str, Any]
+    bells: dict[str, Any]
+    toggles: list[Any]
+    word_counts: dict[str, Any]
+    holdings: dict[str, Any]
+
+    @classmethod
+    def from_snapshot(cls, snapshot: dict[str, Any]) -> _StateView:
+        effects: dict[int, dict[str, Any]] = {}
+        for key, value in _as_dict(snapshot.get("effects")).items():
+            try:
+                index = int(key)
+            except Exception:
+                continue
+            effects[index] = value if isinstance(value, dict) else {}
+
+        assignments: dict[str, int] = {}
+        for token, player in _as_dict(snapshot.get("token_assignments")).items():
+            if isinstance(player, str):
+                try:
+                    assignments[player] = int(token)
+                except Exception:
+                    continue
+
+        proposals = snapshot.get("proposals")
+        toggles = snapshot.get("toggles")
+        return cls(
+            round_number=snapshot.get("round", "-"),
+            phase=str(snapshot.get("phase", "-")).upper(),
+            proposals=proposals if isinstance(proposals, list) else [],
+            effects=effects,
+            votes=_as_dict(snapshot.get("votes")),
+            assignments=assignments,
+            vote_changes=_as_dict(snapshot.get("vote_changes")),
+            bells=_as_dict(snapshot.get("bells")),
+            toggles=toggles if isinstance(toggles, list) else [],
+            word_counts=_as_dict(snapshot.get("word_counts")),
+            holdings=_as_dict(snapshot.get("holdings")),
+        )
 
 
 @dataclass
 class GameDisplay:
     max_lines: int = 20
     history_lines: int = 500
-    chat_lines: list[str] = field(default_factory=list)
-    ruling_lines: list[str] = field(default_factory=list)
-    event_lines: list[str] = field(default_factory=list)
+    chat_lines: deque[str] = field(default_factory=deque)
+    ruling_lines: deque[str] = field(default_factory=deque)
+    event_lines: deque[str] = field(default_factory=deque)
     state_snapshot: dict[str, Any] = field(default_factory=dict)
+    # Headless runs never render, so line history is not kept.
+    enabled: bool = True
+    # Formatted Text per raw line; lines never change once added, so re-renders reuse them.
+    _line_cache: dict[str, Text] = field(default_factory=dict, init=False, repr=False)
+    # Compact state tables by name, with the snapshot slice each was built from.
+    _panel_cache: dict[str, tuple[Any, Table]] = field(default_factory=dict, init=False, repr=False)
+    _view: _StateView = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # Bounded ring buffers: appends drop the oldest line instead of re-slicing the history.
+        self.chat_lines = deque(self.chat_lines, maxlen=self.history_lines)
+        self.ruling_lines = deque(self.ruling_lines, maxlen=self.history_lines)
+        self.event_lines = deque(self.event_lines, maxlen=self.history_lines)
+        self._view = _StateView.from_snapshot(self.state_snapshot)
 
     def add_chat(self, line: str) -> None:
+        if not self.enabled:
+            return
         self.chat_lines.append(line)
-        self.chat_lines = self.chat_lines[-self.history_lines :]
 
     def add_ruling(self, line: str) -> None:
+        if not self.enabled:
+            return
         self.ruling_lines.append(line)
-        self.ruling_lines = self.ruling_lines[-self.history_lines :]
 
     def add_event(self, line: str) -> None:
+        if not self.enabled:
+            return
         self.event_lines.append(line)
-        self.event_lines = self.event_lines[-self.history_lines :]
         self.chat_lines.append(f"{EVENT_PREFIX}{line}")
-        self.chat_lines = self.chat_lines[-self.history_lines :]
 
     def set_state(self, state: dict[str, Any]) -> None:
         self.state_snapshot = state
+        self._view = _StateView.from_snapshot(state)
 
     def _style_character_names(self, content: str) -> Text:
         styled = Text(content)
-        for name, style in CHARACTER_STYLES.items():
-            styled.highlight_words([name], style=style, case_sensitive=True)
+        # Most state and usage lines name nobody; a bare search skips Rich's highlight machinery for them.
+        if _CHARACTER_NAME_RE.search(content):
+            styled.highlight_regex(_CHARACTER_NAME_RE, style=CHARACTER_STYLES.get)
         return styled
 
+    def _tail(self, lines: deque[str]) -> list[str]:
+        # Walks only the visible lines from the right end of the ring buffer.
+        tail = list(islice(reversed(lines), self.max_lines))
+        tail.reverse()
+        return tail
+
     def _pane_lines(self, pane: str) -> list[str]:
         if pane == "chat":
-            return self.chat_lines
+            return self._tail(self.chat_lines)
         if pane == "rulings":
-            return self.ruling_lines
+            return self._tail(self.ruling_lines)
         if pane == "events":
-            return self.event_lines
+            return self._tail(self.event_lines)
         if pane == "state":
             return self._state_lines()
         if pane == "usage":
@@ -142,6 +247,16 @@ class GameDisplay:
         return []
 
     def _format_sender_line(self, line: str) -> Text:
+        # Callers only copy or render the result, so cached Text objects are shared, not copied.
+        cached = self._line_cache.get(line)
+        if cached is None:
+            cached = self._line_cache[line] = self._build_sender_line(line)
+            if len(self._line_cache) > self.history_lines:
+                # Oldest first: evicted lines have usually scrolled out of every pane.
+                del self._line_cache[next(iter(self._line_cache))]
+        return cached
+
+    def _build_sender_line(self, line: str) -> Text:
         raw = line.strip()
         if ":" not in raw:
             return self._style_character_names(raw)
@@ -184,7 +299,7 @@ class GameDisplay:
         return "cyan"
 
     def _render_chat_view(self) -> Any:
-        lines = self.chat_lines[-self.max_lines :]
+        lines = self._tail(self.chat_lines)
         if not lines:
             return Text("No data yet")
 
@@ -199,33 +314,17 @@ class GameDisplay:
         return _TailViewport(Group(*chunks))
 
     def _state_lines(self) -> list[str]:
-        round_number = self.state_snapshot.get("round", "-")
-        phase = str(self.state_snapshot.get("phase", "-")).upper()
-        proposals = self.state_snapshot.get("proposals", [])
-        effects_raw = self.state_snapshot.get("effects", {})
-        effects: dict[int, dict[str, str]] = {}
-        if isinstance(effects_raw, dict):
-            for key, value in effects_raw.items():
-                try:
-                    index = int(key)
-                except Exception:
-                    continue
-                effects[index] = value if isinstance(value, dict) else {}
-
-        votes = self.state_snapshot.get("votes", {}) if isinstance(self.state_snapshot.get("votes", {}), dict) else {}
-        assignments_raw = self.state_snapshot.get("token_assignments", {})
-        assignments: dict[str, int] = {}
-        if isinstance(assignments_raw, dict):
-            for token, player in assignments_raw.items():
-                if isinstance(player, str):
-                    try:
-                        assignments[player] = int(token)
-                    except Exception:
-                        continue
-        vote_changes = self.state_snapshot.get("vote_changes", {}) if isinstance(self.state_snapshot.get("vote_changes", {}), dict) else {}
-        bells = self.state_snapshot.get("bells", {}) if isinstance(self.state_snapshot.get("bells", {}), dict) else {}
-        toggles = self.state_snapshot.get("toggles", []) if isinstance(self.state_snapshot.get("toggles", []), list) else []
-        word_counts = self.state_snapshot.get("word_counts", {}) if isinstance(self.state_snapshot.get("word_counts", {}), dict) else {}
+        view = self._view
+        round_number = view.round_number
+        phase = view.phase
+        proposals = view.proposals
+        effects = view.effects
+        votes = view.votes
+        assignments = view.assignments
+        vote_changes = view.vote_changes
+        bells = view.bells
+        toggles = view.toggles
+        word_counts = view.word_counts
 
         def _bar(value: int) -> str:
             return "#" * max(0, min(value, 14))
@@ -237,11 +336,10 @@ class GameDisplay:
         lines.append("")
 
         lines.append("PROPOSAL BOARD")
-        if isinstance(proposals, list) and proposals:
+        if proposals:
             for index, proposal in enumerate(proposals):
                 name = str(proposal)
-                p_type = PROPOSAL_TYPES.get(name, "unknown")
-                majority_pattern, consensus_pattern = PROPOSAL_PATTERNS.get(name, ("---", "----"))
+                p_type, majority_pattern, consensus_pattern = PROPOSAL_INFO.get(name, _UNKNOWN_PROPOSAL)
                 effect_info = effects.get(index, {})
                 majority_effect = str(effect_info.get("majority", "-"))
                 consensus_effect = str(effect_info.get("consensus", "-"))
@@ -312,61 +410,79 @@ class GameDisplay:
             output.append(row)
             output.append("\n")
 
-        legend = Text("Legend: ")
-        for owner in CHARACTER_ORDER:
-            legend.append(TOKEN_DOT, style=CHARACTER_STYLES.get(owner, "white"))
-            legend.append(f" {owner}  ")
-        output.append(legend)
+        output.append(_TOKEN_LEGEND)
         return output
 
     def _render_state_compact(self) -> Columns:
-        round_number = self.state_snapshot.get("round", "-")
-        phase = str(self.state_snapshot.get("phase", "-")).upper()
-        proposals = self.state_snapshot.get("proposals", [])
-        effects_raw = self.state_snapshot.get("effects", {})
-        effects: dict[int, dict[str, str]] = {}
-        if isinstance(effects_raw, dict):
-            for key, value in effects_raw.items():
-                try:
-                    index = int(key)
-                except Exception:
-                    continue
-                effects[index] = value if isinstance(value, dict) else {}
+        view = self._view
+        round_number = view.round_number
+        phase = view.phase
+        proposals = view.proposals
+        effects = view.effects
+        votes = view.votes
+        assignments = view.assignments
+        vote_changes = view.vote_changes
+        bells = view.bells
+        toggles = view.toggles
+        word_counts = view.word_counts
+        holdings = view.holdings
+
+        # Each table is keyed on the snapshot slices it reads and rebuilt only when those change.
+        return Columns(
+            [
+                self._cached_panel(
+                    "overview",
+                    (round_number, phase, proposals, toggles),
+                    lambda: self._build_overview_table(round_number, phase, proposals, toggles),
+                ),
+                self._cached_panel(
+                    "proposals",
+                    (proposals, effects),
+                    lambda: self._build_proposal_table(proposals, effects),
+                ),
+                self._cached_panel(
+                    "votes",
+                    (votes, assignments, vote_changes),
+                    lambda: self._build_votes_table(votes, assignments, vote_changes),
+                ),
+                self._cached_panel("bells", bells, lambda: self._build_bells_table(bells)),
+                self._cached_panel("words", word_counts, lambda: self._build_words_table(word_counts)),
+                self._cached_panel("holdings", holdings, lambda: self._build_holdings_table(holdings)),
+            ],
+            expand=True,
+            padding=(0, 2),
+            equal=False,
+        )
 
-        votes = self.state_snapshot.get("votes", {}) if isinstance(self.state_snapshot.get("votes", {}), dict) else {}
-        assignments_raw = self.state_snapshot.get("token_assignments", {})
-        assignments: dict[str, int] = {}
-        if isinstance(assignments_raw, dict):
-            for token, player in assignments_raw.items():
-                if isinstance(player, str):
-                    try:
-                        assignments[player] = int(token)
-                    except Exception:
-                        continue
-        vote_changes = self.state_snapshot.get("vote_changes", {}) if isinstance(self.state_snapshot.get("vote_changes", {}), dict) else {}
-        bells = self.state_snapshot.get("bells", {}) if isinstance(self.state_snapshot.get("bells", {}), dict) else {}
-        toggles = self.state_snapshot.get("toggles", []) if isinstance(self.state_snapshot.get("toggles", []), list) else []
-        word_counts = self.state_snapshot.get("word_counts", {}) if isinstance(self.state_snapshot.get("word_counts", {}), dict) else {}
-        holdings = self.state_snapshot.get("holdings", {}) if isinstance(self.state_snapshot.get("holdings", {}), dict) else {}
+    def _cached_panel(self, name: str, key: Any, build: Callable[[], Table]) -> Table:
+        # Snapshots are freshly exported dicts, so comparing by value is safe and cheaper than rebuilding.
+        cached = self._panel_cache.get(name)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        table = build()
+        self._panel_cache[name] = (key, table)
+        return table
 
+    def _build_overview_table(self, round_number: Any, phase: str, proposals: list[Any], toggles: list[Any]) -> Table:
         overview = Table(show_header=False, box=box.SIMPLE, pad_edge=False)
         overview.add_column("key", style="bold")
         overview.add_column("value")
         overview.add_row("Round", str(round_number))
         overview.add_row("Phase", phase)
-        overview.add_row("Proposals", str(len(proposals) if isinstance(proposals, list) else 0))
+        overview.add_row("Proposals", str(len(proposals)))
         overview.add_row("Toggles", ", ".join(str(toggle) for toggle in toggles) if toggles else "None")
+        return overview
 
+    def _build_proposal_table(self, proposals: list[Any], effects: dict[int, dict[str, Any]]) -> Table:
         proposal_table = Table(title="Proposals", show_header=True, box=box.SIMPLE, pad_edge=False)
         proposal_table.add_column("P", style="bold")
         proposal_table.add_column("Name")
         proposal_table.add_column("Maj", overflow="fold")
         proposal_table.add_column("Con", overflow="fold")
-        if isinstance(proposals, list) and proposals:
+        if proposals:
             for index, proposal in enumerate(proposals):
                 name = str(proposal)
-                p_type = PROPOSAL_TYPES.get(name, "unknown")
-                majority_pattern, consensus_pattern = PROPOSAL_PATTERNS.get(name, ("---", "----"))
+                p_type, majority_pattern, consensus_pattern = PROPOSAL_INFO.get(name, _UNKNOWN_PROPOSAL)
                 effect_info = effects.get(index, {})
                 majority_effect = str(effect_info.get("majority", "-"))
                 consensus_effect = str(effect_info.get("consensus", "-"))
@@ -378,7 +494,11 @@ class GameDisplay:
                 )
         else:
             proposal_table.add_row("-", "No proposals", "-", "-")
+        return proposal_table
 
+    def _build_votes_table(
+        self, votes: dict[str, Any], assignments: dict[str, int], vote_changes: dict[str, Any]
+    ) -> Table:
         votes_table = Table(title="Votes", show_header=True, box=box.SIMPLE, pad_edge=False)
         votes_table.add_column("Player")
         votes_table.add_column("Tok", justify="right")
@@ -391,7 +511,9 @@ class GameDisplay:
             vote_text = f"P{vote_value}" if isinstance(vote_value, int) else "-"
             flips = int(vote_changes.get(player, 0)) if player in vote_changes else 0
             votes_table.add_row(self._style_character_names(player), token_text, vote_text, str(flips))
+        return votes_table
 
+    def _build_bells_table(self, bells: dict[str, Any]) -> Table:
         bells_table = Table(title="Bells", show_header=True, box=box.SIMPLE, pad_edge=False)
         bells_table.add_column("Season")
         bells_table.add_column("Count", justify="right")
@@ -399,13 +521,17 @@ class GameDisplay:
         for season in ("spring", "summer", "autumn", "winter"):
             value = int(bells.get(season, 0))
             bells_table.add_row(season.title(), str(value), "#" * max(0, min(value, 14)))
+        return bells_table
 
+    def _build_words_table(self, word_counts: dict[str, Any]) -> Table:
         words_table = Table(title="Word Counts", show_header=True, box=box.SIMPLE, pad_edge=False)
         words_table.add_column("Player")
         words_table.add_column("Words", justify="right")
         for player in CHARACTER_ORDER:
             words_table.add_row(self._style_character_names(player), str(int(word_counts.get(player, 0))))
+        return words_table
 
+    def _build_holdings_table(self, holdings: dict[str, Any]) -> Table:
         holdings_table = Table(title="Promise Holdings", show_header=True, box=box.SIMPLE, pad_edge=False)
         holdings_table.add_column("Holder")
         for owner in CHARACTER_ORDER:
@@ -416,13 +542,7 @@ class GameDisplay:
             for owner in CHARACTER_ORDER:
                 row.append(str(int(owned.get(owner, 0))))
             holdings_table.add_row(*row)
-
-        return Columns(
-            [overview, proposal_table, votes_table, bells_table, words_table, holdings_table],
-            expand=True,
-            padding=(0, 2),
-            equal=False,
-        )
+        return holdings_table
 
     def _usage_lines(self) -> list[str]:
         usage = self.state_snapshot.get("llm_usage", {})
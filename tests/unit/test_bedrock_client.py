@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from src.config.settings import SimulationConfig
+from src.llm import bedrock_client
+from src.llm.bedrock_client import BedrockConverseClient
+
+
+class FakeRuntime:
+    def __init__(self) -> None:
+        self.calls: list[dict[str, Any]] = []
+
+    def converse(self, **payload: Any) -> dict[str, Any]:
+        self.calls.append(payload)
+        return {"output": {"message": {"content": [{"text": "ok"}]}}, "stopReason": "end_turn"}
+
+
+def _client(**overrides: Any) -> tuple[BedrockConverseClient, FakeRuntime]:
+    client = BedrockConverseClient(SimulationConfig(aws_profile=None, **overrides))
+    runtime = FakeRuntime()
+    client.client = runtime
+    return client, runtime
+
+
+@pytest.mark.asyncio
+async def test_tool_calls_append_cache_points_to_system_and_tools() -> None:
+    client, runtime = _client()
+    tools = [{"toolSpec": {"name": "no_action"}}]
+
+    await client.converse_with_tools("system", "user", tools=tools)
+
+    payload = runtime.calls[0]
+    assert payload["system"] == [{"text": "system"}, {"cachePoint": {"type": "default"}}]
+    assert payload["toolConfig"]["tools"][-1] == {"cachePoint": {"type": "default"}}
+    assert tools == [{"toolSpec": {"name": "no_action"}}]
+
+
+@pytest.mark.asyncio
+async def test_cache_points_can_be_disabled() -> None:
+    client, runtime = _client(prompt_cache_enabled=False)
+
+    await client.converse_with_tools("system", "user", tools=[])
+
+    assert runtime.calls[0]["system"] == [{"text": "system"}]
+
+
+@pytest.mark.asyncio
+async def test_tool_config_is_reused_for_the_same_tool_set() -> None:
+    client, runtime = _client()
+    tools = [{"toolSpec": {"name": "no_action"}}]
+
+    await client.converse_with_tools("system", "first", tools=tools)
+    await client.converse_with_tools("system", "second", tools=tools)
+
+    assert runtime.calls[0]["toolConfig"] is runtime.calls[1]["toolConfig"]
+
+
+class FakeSts:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def get_caller_identity(self) -> dict[str, Any]:
+        self.calls += 1
+        return {"Account": "123", "Arn": "arn:aws:iam::123:user/test"}
+
+
+@pytest.mark.asyncio
+async def test_preflight_identity_is_cached_between_clients(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(bedrock_client, "_PREFLIGHT_CACHE_DIR", tmp_path)
+    sts = FakeSts()
+    first, _ = _client()
+    second, _ = _client(model_id="other-model")
+    first.sts = second.sts = sts
+
+    identity = await first.preflight_check()
+    cached = await second.preflight_check()
+
+    assert sts.calls == 1
+    assert identity["arn"] == cached["arn"] == "arn:aws:iam::123:user/test"
+    assert cached["model_id"] == "other-model"
+
+
+@pytest.mark.asyncio
+async def test_preflight_cache_can_be_disabled(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(bedrock_client, "_PREFLIGHT_CACHE_DIR", tmp_path)
+    sts = FakeSts()
+    client, _ = _client(preflight_cache_ttl_seconds=0)
+    client.sts = sts
+
+    await client.preflight_check()
+    await client.preflight_check()
+
+    assert sts.calls == 2
+    assert not any(tmp_path.iterdir())
+
+
+def test_runtime_pool_covers_the_parallel_limit() -> None:
+    client = BedrockConverseClient(SimulationConfig(aws_profile=None, llm_max_parallel=16))
+
+    assert client.client.meta.config.max_pool_connections == 16
+
+
+class FlakyRuntime(FakeRuntime):
+    def __init__(self, failures: int) -> None:
+        super().__init__()
+        self.failures = failures
+
+    def converse(self, **payload: Any) -> dict[str, Any]:
+        if self.failures:
+            self.failures -= 1
+            self.calls.append(payload)
+            raise RuntimeError("throttled")
+        return super().converse(**payload)
+
+
+@pytest.mark.asyncio
+async def test_retries_resend_the_same_payload_with_jittered_backoff(monkeypatch: pytest.MonkeyPatch) -> None:
+    sleeps: list[float] = []
+
+    async def fake_sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+
+    monkeypatch.setattr(bedrock_client.asyncio, "sleep", fake_sleep)
+    client, _ = _client(request_retries=2, request_retry_backoff_seconds=(1.0, 2.0))
+    runtime = FlakyRuntime(failures=2)
+    client.client = runtime
+
+    result = await client.converse_with_tools("system", "user", tools=[])
+
+    assert result.attempts == 3
+    assert runtime.calls[0]["system"] is runtime.calls[1]["system"] is runtime.calls[2]["system"]
+    assert 0.8 <= sleeps[0] <= 1.2 and 1.6 <= sleeps[1] <= 2.4
+
+
+@pytest.mark.asyncio
+async def test_exhausted_retries_raise_with_the_call_label(monkeypatch: pytest.MonkeyPatch) -> None:
+    async def fake_sleep(seconds: float) -> None:
+        return None
+
+    monkeypatch.setattr(bedrock_client.asyncio, "sleep", fake_sleep)
+    client, _ = _client(request_retries=1)
+    client.client = FlakyRuntime(failures=2)
+
+    with pytest.raises(RuntimeError, match=r"^Bedrock converse failed after 2 attempts"):
+        await client.converse("system", "user")
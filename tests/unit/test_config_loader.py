@@ -38,3 +38,18 @@ strategy_doc_players: [Carmichael, Quincy]
     assert cfg.request_retry_backoff_seconds == (0.5, 1.5)
     assert cfg.agent_models == {"Carmichael": "model-sonnet", "Referee": "model-haiku"}
     assert cfg.strategy_doc_players == ["Carmichael", "Quincy"]
+
+
+def test_load_simulation_config_reuses_parse_until_file_changes(tmp_path: Path) -> None:
+    config_path = tmp_path / "config.yml"
+    config_path.write_text("max_rounds: 4\nagent_models:\n  Quincy: model-a\n", encoding="utf-8")
+
+    first = load_simulation_config(str(config_path))
+    first.agent_models["Quincy"] = "mutated"
+    second = load_simulation_config(str(config_path))
+
+    assert second is not first
+    assert second.agent_models == {"Quincy": "model-a"}
+
+    config_path.write_text("max_rounds: 12\n", encoding="utf-8")
+    assert load_simulation_config(str(config_path)).max_rounds == 12
@@ -1,8 +1,16 @@
 from __future__ import annotations
 
-from src.game.cards import EFFECT_CARDS
+from src.game.cards import EFFECT_CARDS, PROPOSAL_CARDS
+from src.game.models import Season
 
 
 def test_gemini_season_removed_from_active_effect_deck() -> None:
     effect_names = {card.name for card in EFFECT_CARDS}
     assert "Gemini Season" not in effect_names
+
+
+def test_proposal_bell_slots_match_seasons() -> None:
+    seasons = tuple(Season)
+    for card in PROPOSAL_CARDS:
+        assert tuple(seasons[i] for i in card.majority_idx) == card.majority
+        assert tuple(seasons[i] for i in card.consensus_idx) == card.consensus
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import pytest
+
+from src.messaging import event_bus
+from src.messaging.event_bus import EventBus
+
+
+@pytest.mark.asyncio
+async def test_every_subscriber_receives_every_event() -> None:
+    bus = EventBus()
+    first, second = bus.subscribe(), bus.subscribe()
+
+    bus.publish({"type": "round_started"})
+    bus.publish({"type": "round_resolved"})
+
+    assert [await anext(first), await anext(first)] == [{"type": "round_started"}, {"type": "round_resolved"}]
+    assert [await anext(second), await anext(second)] == [{"type": "round_started"}, {"type": "round_resolved"}]
+
+    await first.aclose()
+    await second.aclose()
+    assert bus._subscribers == []
+
+
+@pytest.mark.asyncio
+async def test_slow_subscriber_drops_oldest_events(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(event_bus, "_SUBSCRIBER_BACKLOG", 2)
+    bus = EventBus()
+    events = bus.subscribe()
+
+    for round_number in range(3):
+        bus.publish({"round": round_number})
+
+    assert [await anext(events), await anext(events)] == [{"round": 1}, {"round": 2}]
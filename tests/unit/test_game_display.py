@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import io
+
+from rich.console import Console
+from rich.panel import Panel
+
+from src.ui.game_display import GameDisplay
+
+
+def test_sender_lines_are_formatted_once_and_cache_is_bounded() -> None:
+    display = GameDisplay(history_lines=3)
+
+    first = display._format_sender_line("Quincy: hello")
+    assert first.plain == "🎩 Quincy: hello"
+    assert display._format_sender_line("Quincy: hello") is first
+
+    for index in range(3):
+        display._format_sender_line(f"Medici: line {index}")
+    assert len(display._line_cache) == 3
+    assert "Quincy: hello" not in display._line_cache
+
+
+def test_character_names_are_styled_in_one_pass() -> None:
+    styled = GameDisplay()._style_character_names("Referee: Quincy pays D'Ambrosio and Quincy")
+
+    assert [(styled.plain[span.start : span.end], span.style) for span in styled.spans] == [
+        ("Referee", "bright_cyan"),
+        ("Quincy", "orange1"),
+        ("D'Ambrosio", "blue"),
+        ("Quincy", "orange1"),
+    ]
+
+
+def test_state_tables_are_rebuilt_only_when_their_slice_changes() -> None:
+    display = GameDisplay()
+    display.set_state({"round": 1, "phase": "negotiation", "word_counts": {"Quincy": 2}, "bells": {"spring": 1}})
+    display._render_state_compact()
+    first = {name: table for name, (_, table) in display._panel_cache.items()}
+
+    display.set_state({"round": 1, "phase": "negotiation", "word_counts": {"Quincy": 5}, "bells": {"spring": 1}})
+    display._render_state_compact()
+
+    assert display._panel_cache["words"][1] is not first["words"]
+    assert display._panel_cache["bells"][1] is first["bells"]
+    assert display._panel_cache["overview"][1] is first["overview"]
+
+
+def test_line_history_is_a_bounded_ring_and_panes_show_the_tail() -> None:
+    display = GameDisplay(max_lines=2, history_lines=3)
+    chat = display.chat_lines
+
+    for index in range(5):
+        display.add_ruling(f"ruling {index}")
+        display.add_chat(f"Quincy: line {index}")
+
+    assert display.chat_lines is chat
+    assert list(display.ruling_lines) == ["ruling 2", "ruling 3", "ruling 4"]
+    assert display._pane_lines("rulings") == ["ruling 3", "ruling 4"]
+
+
+def test_chat_viewport_shows_the_newest_lines_when_it_overflows() -> None:
+    display = GameDisplay()
+    for index in range(20):
+        display.add_chat(f"Quincy: message {index}")
+    console = Console(width=60, height=8, file=io.StringIO(), record=True)
+
+    console.print(Panel(display._render_chat_view(), height=8))
+
+    rows = console.export_text().splitlines()[1:-1]
+    assert [row.strip("│ ").split()[-1] for row in rows] == ["14", "15", "16", "17", "18", "19"]
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import json
+
+from src.logging import game_logger
+from src.logging.game_logger import GameLogger, SummaryGameLogger
+
+
+def test_records_are_buffered_until_flush(tmp_path) -> None:
+    logger = GameLogger(root=str(tmp_path), game_id="buffered")
+    events_path = logger.run_dir / "events.jsonl"
+
+    logger.log_event("round_started", 1, "deal", {"round": 1})
+    logger.log_transcript_line("Quincy: hello")
+    assert not events_path.exists()
+
+    logger.flush()
+
+    [record] = [json.loads(line) for line in events_path.read_text(encoding="utf-8").splitlines()]
+    assert record["type"] == "round_started"
+    assert (logger.run_dir / "transcript.md").read_text(encoding="utf-8") == "- Quincy: hello\n"
+
+
+def test_buffer_flushes_when_full_and_on_exit(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(game_logger, "_FLUSH_MAX_LINES", 3)
+    with GameLogger(root=str(tmp_path), game_id="batched") as logger:
+        transcript_path = logger.run_dir / "transcript.md"
+        for i in range(4):
+            logger.log_transcript_line(f"line {i}")
+        assert transcript_path.read_text(encoding="utf-8").count("\n") == 3
+
+    assert transcript_path.read_text(encoding="utf-8").count("\n") == 4
+
+
+def test_summary_logger_keeps_only_round_results_and_summary(tmp_path) -> None:
+    with SummaryGameLogger(root=str(tmp_path), game_id="summary") as logger:
+        assert not logger.records_llm
+        logger.log_event("player_message", 1, "negotiation", {"text": "hi"})
+        logger.log_event("round_resolved", 1, "resolution", {"passed": 0})
+        logger.log_event("game_complete", 1, "complete", {"winners": []})
+        logger.log_llm(role="player", player="Quincy", prompt={}, response_text="", raw_response=None, metadata={})
+        logger.log_transcript_line("Quincy: hi")
+
+    lines = (logger.run_dir / "events.jsonl").read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["type"] for line in lines] == ["round_resolved", "game_complete"]
+    assert not (logger.run_dir / "raw_llm.jsonl").exists()
+    assert not (logger.run_dir / "transcript.md").exists()
+
+
+def test_event_payloads_keep_int_keys_and_unicode(tmp_path) -> None:
+    with GameLogger(root=str(tmp_path), game_id="payload") as logger:
+        logger.log_event("token_taken", 1, "negotiation", {"token_assignments": {3: "D'Ambrosio"}, "note": "café"})
+
+    [record] = [json.loads(line) for line in (logger.run_dir / "events.jsonl").read_text(encoding="utf-8").splitlines()]
+    assert record["payload"] == {"token_assignments": {"3": "D'Ambrosio"}, "note": "café"}
+
+
+def test_timestamps_are_millisecond_iso_and_shared_within_a_tick(tmp_path, monkeypatch) -> None:
+    logger = GameLogger(root=str(tmp_path), game_id="clock")
+    monkeypatch.setattr(game_logger.time, "time_ns", lambda: 1_700_000_000_123_456_789)
+
+    first = logger._now_iso()
+    assert first == "2023-11-14T22:13:20.123+00:00"
+    assert logger._now_iso() is first
@@ -22,3 +22,13 @@ def test_try_extract_json_object_from_python_dict_like_text() -> None:
 
 def test_try_extract_json_object_returns_none_for_no_object() -> None:
     assert try_extract_json_object("just plain prose") is None
+
+
+def test_try_extract_json_object_takes_first_balanced_object_from_prose() -> None:
+    text = 'I will vote now {"vote": 1, "utterance": "closing } brace \\" and \\\\"} then {"vote": 0} later.'
+    assert try_extract_json_object(text) == {"vote": 1, "utterance": 'closing } brace " and \\'}
+
+
+def test_try_extract_json_object_skips_unparseable_braces_before_the_object() -> None:
+    text = "Plan {maybe later} then {'attempt_take_token': 3} ok"
+    assert try_extract_json_object(text) == {"attempt_take_token": 3}
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import asyncio
+
+import pytest
+
 from src.config.settings import SimulationConfig
 from src.game.models import Character
-from src.game.orchestrator import SimulationOrchestrator
+from src.game.orchestrator import _ENFORCEMENT_KEYWORDS, _ENFORCEMENT_STEMS, SimulationOrchestrator
 
 
 def test_orchestrator_applies_agent_model_overrides(tmp_path) -> None:
@@ -21,6 +25,8 @@ def test_orchestrator_applies_agent_model_overrides(tmp_path) -> None:
     assert orchestrator.player_agents[Character.CARMICHAEL].llm.config.model_id == "model-sonnet"
     assert orchestrator.player_agents[Character.QUINCY].llm.config.model_id == "model-default-haiku"
     assert orchestrator.referee.llm.config.model_id == "model-referee-sonnet"
+    assert orchestrator.player_agents[Character.CARMICHAEL].llm.client is orchestrator.llm.client
+    assert orchestrator.referee.llm.client is orchestrator.llm.client
 
 
 def test_usage_snapshot_accumulates_bedrock_token_counts(tmp_path) -> None:
@@ -109,3 +115,172 @@ def test_infers_vote_enforcement_from_referee_ruling_text(tmp_path) -> None:
     )
 
     assert engine.state.votes[Character.QUINCY] == 1
+
+
+@pytest.mark.asyncio
+async def test_llm_calls_respect_the_parallel_limit(tmp_path) -> None:
+    orchestrator = SimulationOrchestrator(
+        SimulationConfig(max_rounds=1, seed=5, log_root=str(tmp_path), llm_max_parallel=2),
+        visual=False,
+    )
+    in_flight = 0
+    peak = 0
+
+    async def fake_request() -> dict[str, int]:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return {"ok": 1}
+
+    results = await asyncio.gather(*(orchestrator._llm_call(fake_request(), "voting") for _ in range(5)))
+
+    assert results == [{"ok": 1}] * 5
+    assert peak == 2
+
+
+def test_transcript_tail_text_is_reused_until_a_line_is_added(tmp_path) -> None:
+    orchestrator = SimulationOrchestrator(
+        SimulationConfig(max_rounds=1, seed=5, log_root=str(tmp_path)),
+        visual=False,
+    )
+    transcript = orchestrator.engine.state.transcript
+    transcript.extend(f"line {i}" for i in range(25))
+
+    tail = orchestrator._transcript_tail_text(20)
+    assert tail.splitlines() == [f"line {i}" for i in range(5, 25)]
+    assert orchestrator._transcript_tail_text(20) is tail
+
+    transcript.append("line 25")
+    assert orchestrator._transcript_tail_text(20).splitlines()[-1] == "line 25"
+    assert orchestrator._transcript_tail_text(2) == "line 24\nline 25"
+
+
+@pytest.mark.asyncio
+async def test_negotiation_retry_backoff_gives_up_after_max_retries(tmp_path, monkeypatch) -> None:
+    orchestrator = SimulationOrchestrator(
+        SimulationConfig(max_rounds=1, seed=5, log_root=str(tmp_path), agent_max_retries=2),
+        visual=False,
+    )
+    delays: list[float] = []
+
+    async def fake_sleep(seconds: float) -> None:
+        delays.append(seconds)
+
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+
+    assert await orchestrator._negotiation_retry_backoff(Character.QUINCY, 1)
+    assert await orchestrator._negotiation_retry_backoff(Character.QUINCY, 2)
+    assert not await orchestrator._negotiation_retry_backoff(Character.QUINCY, 3)
+
+    assert len(delays) == 2
+    assert 0.1 <= delays[0] <= 0.3
+    assert 0.2 <= delays[1] <= 0.6
+
+
+@pytest.mark.asyncio
+async def test_refresh_requests_are_coalesced_into_one_render(tmp_path) -> None:
+    orchestrator = SimulationOrchestrator(
+        SimulationConfig(max_rounds=1, seed=5, log_root=str(tmp_path)),
+        visual=False,
+    )
+
+    class FakeLive:
+        updates = 0
+
+        def update(self, _renderable: object) -> None:
+            FakeLive.updates += 1
+
+    orchestrator._live = FakeLive()  # type: ignore[assignment]
+    for _ in range(10):
+        orchestrator._refresh_state()
+
+    render_task = asyncio.create_task(orchestrator._render_loop())
+    await asyncio.sleep(0.05)
+    render_task.cancel()
+    await asyncio.gather(render_task, return_exceptions=True)
+
+    assert FakeLive.updates == 1
+    assert orchestrator.display.state_snapshot["round"] == 1
+
+
+def test_extract_human_ruling_lines_handles_fenced_json_and_plain_text(tmp_path) -> None:
+    orchestrator = SimulationOrchestrator(
+        SimulationConfig(max_rounds=1, seed=5, log_root=str(tmp_path)),
+        visual=False,
+    )
+
+    fenced = '```json\n{"rulings": ["Quincy `must` vote 1", " "]}\n```'
+    assert orchestrator._extract_human_ruling_lines(fenced) == ["Quincy must vote 1"]
+
+    plain = "```\nFirst ruling\n\nSecond   ruling\n```"
+    assert orchestrator._extract_human_ruling_lines(plain) == ["First ruling", "Second ruling"]
+
+
+def test_per_operation_timeouts_fall_back_to_request_timeout(tmp_path) -> None:
+    orchestrator = SimulationOrchestrator(
+        SimulationConfig(
+            max_rounds=1,
+            seed=5,
+            log_root=str(tmp_path),
+            llm_request_timeout_seconds=45,
+            vote_timeout_seconds=20,
+            referee_timeout_seconds=60,
+        ),
+        visual=False,
+    )
+
+    assert orchestrator._llm_timeouts == {
+        "negotiation": 45,
+        "voting": 20,
+        "vote_change": 45,
+        "referee": 60,
+    }
+
+
+def test_headless_display_keeps_no_line_history(tmp_path) -> None:
+    orchestrator = SimulationOrchestrator(
+        SimulationConfig(max_rounds=1, seed=5, log_root=str(tmp_path)),
+        visual=False,
+    )
+
+    orchestrator.display.add_event("Voting phase started")
+    orchestrator.display.add_ruling("Quincy must vote 1")
+    orchestrator.display.add_chat("Quincy: hello")
+
+    assert not orchestrator.display.event_lines
+    assert not orchestrator.display.ruling_lines
+    assert not orchestrator.display.chat_lines
+
+
+class _IdleAgent:
+    async def negotiation_action(self, state, transcript_tail, scratchpad, token_mask):  # noqa: ANN001, ANN201
+        return {"_control_action": "no_action", "scratchpad": scratchpad}
+
+
+@pytest.mark.asyncio
+async def test_negotiation_supervisor_wakes_for_deadlock_check(tmp_path) -> None:
+    orchestrator = SimulationOrchestrator(
+        SimulationConfig(
+            max_rounds=1,
+            seed=5,
+            log_root=str(tmp_path),
+            negotiation_deadlock_seconds=0.2,  # type: ignore[arg-type]
+            no_action_cooldown_base_seconds=1.0,
+        ),
+        visual=False,
+    )
+    orchestrator.player_agents = {character: _IdleAgent() for character in orchestrator.player_agents}  # type: ignore[misc]
+    orchestrator.engine.start_round()
+
+    started = asyncio.get_running_loop().time()
+    await orchestrator._run_negotiation_phase()
+    elapsed = asyncio.get_running_loop().time() - started
+
+    assert orchestrator.engine.all_tokens_taken()
+    assert 0.19 <= elapsed < 0.5
+
+
+def test_enforcement_keyword_stems_cover_every_keyword() -> None:
+    assert all(any(stem in key for stem in _ENFORCEMENT_STEMS) for key in _ENFORCEMENT_KEYWORDS)
@@ -45,7 +45,7 @@ async def test_negotiation_tool_take_token_maps_to_action() -> None:
         character=Character.CARMICHAEL,
     )
 
-    action = await agent.negotiation_action(state={}, transcript_tail=[], scratchpad="")
+    action = await agent.negotiation_action(state={}, transcript_tail="", scratchpad="")
 
     assert action["attempt_take_token"] == 3
     assert "token 3" in action["utterance"].lower()
@@ -69,7 +69,7 @@ async def test_voting_tool_cast_vote_maps_to_vote() -> None:
         character=Character.QUINCY,
     )
 
-    action = await agent.voting_action(state={}, transcript_tail=[], scratchpad="", token_number=1)
+    action = await agent.voting_action(state={}, transcript_tail="", scratchpad="", token_number=1)
 
     assert action["vote"] == 1
     assert "proposal 1" in action["utterance"].lower()
@@ -93,7 +93,7 @@ async def test_negotiation_no_action_is_silent() -> None:
         character=Character.MEDICI,
     )
 
-    action = await agent.negotiation_action(state={}, transcript_tail=[], scratchpad="")
+    action = await agent.negotiation_action(state={}, transcript_tail="", scratchpad="")
 
     assert action["attempt_take_token"] is None
     assert action["utterance"] == ""
@@ -118,7 +118,7 @@ async def test_say_public_explicit_take_token_infers_attempt() -> None:
         character=Character.DAMBROSIO,
     )
 
-    action = await agent.negotiation_action(state={}, transcript_tail=[], scratchpad="")
+    action = await agent.negotiation_action(state={}, transcript_tail="", scratchpad="")
 
     assert action["attempt_take_token"] == 4
     assert action["_control_action"] == "say_public"
@@ -132,8 +132,10 @@ def test_legal_negotiation_tokens_from_state() -> None:
     )
 
     assert agent._legal_negotiation_tokens({"token_assignments": {}}) == [3]
-    assert agent._legal_negotiation_tokens({"token_assignments": {"3": "Quincy", "4": "Medici"}}) == [2, 1]
-    assert agent._legal_negotiation_tokens({"token_assignments": {"3": "Carmichael"}}) == []
+    assert agent._legal_negotiation_tokens({"token_assignments": {3: "Quincy", 4: "Medici"}}) == [2, 1]
+    assert agent._legal_negotiation_tokens({"token_assignments": {3: "Carmichael"}}) == []
+    assert agent._legal_negotiation_tokens({"token_assignments": {3: "Quincy"}}, token_mask=1 << 3) == [4, 2, 1]
+    assert agent._legal_negotiation_tokens({"token_assignments": {}}, token_mask=(1 << 3) | (1 << 2)) == [4, 1]
 
 
 def test_system_prompt_can_disable_strategy_doc() -> None:
@@ -182,7 +184,7 @@ async def test_negotiation_prompt_uses_configured_word_cap() -> None:
         negotiation_word_cap=321,
     )
 
-    action = await agent.negotiation_action(state={}, transcript_tail=[], scratchpad="")
+    action = await agent.negotiation_action(state={}, transcript_tail="", scratchpad="")
     prompt_text = action["_prompt"]["user"]
 
     assert "321-word cap" in prompt_text
@@ -209,9 +211,129 @@ async def test_private_note_updates_scratchpad_not_public_message() -> None:
         character=Character.MEDICI,
     )
 
-    action = await agent.negotiation_action(state={}, transcript_tail=[], scratchpad="")
+    action = await agent.negotiation_action(state={}, transcript_tail="", scratchpad="")
 
     assert action["utterance"] == "I support proposal 0."
     assert "Private note:" in action["scratchpad"]
     assert "Quincy likely flips late" in action["scratchpad"]
     assert "I support proposal 0." not in action["scratchpad"]
+
+
+def test_strategy_brief_is_cached_by_mtime_and_size() -> None:
+    from src.agents import player_agent
+
+    player_agent._STRATEGY_CACHE.clear()
+    first = player_agent._strategy_brief()
+    assert len(player_agent._STRATEGY_CACHE) == 1
+    assert player_agent._strategy_brief() == first
+    assert len(player_agent._STRATEGY_CACHE) == 1
+
+
+def test_system_prompt_is_built_once_per_agent() -> None:
+    agent = PlayerAgent(
+        name="Medici",
+        llm=FakeLLM(_result([])),
+        character=Character.MEDICI,
+        use_strategy_doc=False,
+    )
+
+    assert agent._system_prompt() is agent._system_prompt()
+    assert "You are Medici" in agent._system_prompt()
+
+
+def test_repeated_private_note_does_not_grow_scratchpad() -> None:
+    agent = PlayerAgent(
+        name="Quincy",
+        llm=FakeLLM(_result([])),
+        character=Character.QUINCY,
+        use_strategy_doc=False,
+    )
+
+    first = agent._next_scratchpad("", "hold token 3")
+    assert agent._next_scratchpad(first, "hold token 3") is first
+
+
+@pytest.mark.asyncio
+async def test_transcript_tail_is_rendered_as_plain_lines() -> None:
+    agent = PlayerAgent(
+        name="Quincy",
+        llm=FakeLLM(_result([{"name": "cast_vote", "input": {"proposal_index": 0}, "tool_use_id": "v"}])),
+        character=Character.QUINCY,
+    )
+
+    action = await agent.voting_action(
+        state={}, transcript_tail="Quincy: hi\nMedici: hello", scratchpad="", token_number=2
+    )
+
+    assert "Quincy: hi\nMedici: hello" in action["_prompt"]["user"]
+
+
+@pytest.mark.asyncio
+async def test_state_is_rendered_as_sorted_json() -> None:
+    agent = PlayerAgent(
+        name="Carmichael",
+        llm=FakeLLM(_result([{"name": "no_action", "input": {}, "tool_use_id": "s"}])),
+        character=Character.CARMICHAEL,
+    )
+
+    action = await agent.negotiation_action(
+        state={"round": 2, "token_assignments": {3: "Quincy"}}, transcript_tail="", scratchpad=""
+    )
+
+    assert '{"round":2,"token_assignments":{"3":"Quincy"}}' in action["_prompt"]["user"]
+
+
+@pytest.mark.asyncio
+async def test_vote_change_tool_maps_to_action() -> None:
+    agent = PlayerAgent(
+        name="Medici",
+        llm=FakeLLM(
+            _result([{"name": "force_with_three_tokens", "input": {"new_vote": 1}, "tool_use_id": "f"}])
+        ),
+        character=Character.MEDICI,
+    )
+
+    action = await agent.vote_change_action(
+        state={}, transcript_tail="", scratchpad="", target_player=Character.QUINCY
+    )
+
+    assert action["action"] == "force_with_three_tokens"
+    assert action["new_vote"] == 1
+
+
+@pytest.mark.asyncio
+async def test_voting_without_tool_call_falls_back_to_text() -> None:
+    agent = PlayerAgent(
+        name="Quincy",
+        llm=FakeLLM(_result([], text="  I pick   proposal 1 ")),
+        character=Character.QUINCY,
+    )
+
+    action = await agent.voting_action(state={}, transcript_tail="", scratchpad="keep", token_number=1)
+
+    assert action["vote"] == 0
+    assert action["utterance"] == "I pick proposal 1"
+    assert action["scratchpad"] == "keep"
+    assert action["_parse_warning"] == "no_tool_call_returned"
+
+
+@pytest.mark.asyncio
+async def test_raw_response_is_only_attached_when_requested() -> None:
+    llm = FakeLLM(
+        LLMResult(
+            text="",
+            raw_response={"usage": {"totalTokens": 7}},
+            attempts=1,
+            stop_reason="tool_use",
+            tool_calls=[{"name": "no_action", "input": {}, "tool_use_id": "r"}],
+        )
+    )
+    lean = PlayerAgent(name="Quincy", llm=llm, character=Character.QUINCY)
+    verbose = PlayerAgent(name="Quincy", llm=llm, character=Character.QUINCY, include_raw=True)
+
+    lean_action = await lean.negotiation_action(state={}, transcript_tail="", scratchpad="")
+    verbose_action = await verbose.negotiation_action(state={}, transcript_tail="", scratchpad="")
+
+    assert "_raw_response" not in lean_action
+    assert lean_action["_usage"] == {"totalTokens": 7}
+    assert verbose_action["_raw_response"] == {"usage": {"totalTokens": 7}}
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import pytest
+
+from src.llm.bedrock_client import LLMResult
+from src.referee.referee_agent import RefereeAgent
+
+
+@dataclass
+class FakeLLM:
+    result: LLMResult
+
+    async def converse(self, *args, **kwargs):  # noqa: ANN002, ANN003
+        return self.result
+
+
+@pytest.mark.asyncio
+async def test_raw_response_is_only_attached_when_requested() -> None:
+    llm = FakeLLM(
+        LLMResult(
+            text="1. Quincy committed to vote for proposal 1.",
+            raw_response={"usage": {"totalTokens": 9}},
+            attempts=1,
+            stop_reason="end_turn",
+            tool_calls=[],
+        )
+    )
+    lean = RefereeAgent(name="Referee", llm=llm)
+    verbose = RefereeAgent(name="Referee", llm=llm, include_raw=True)
+
+    lean_ruling = await lean.evaluate_phase_change("negotiation", "voting", {}, [], {}, "")
+    verbose_ruling = await verbose.evaluate_phase_change("negotiation", "voting", {}, [], {}, "")
+
+    assert lean_ruling["rulings"] == ["Quincy committed to vote for proposal 1."]
+    assert "_raw_response" not in lean_ruling
+    assert lean_ruling["_usage"] == {"totalTokens": 9}
+    assert verbose_ruling["_raw_response"] == {"usage": {"totalTokens": 9}}
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 from src.config.settings import SimulationConfig
-from src.game.engine import RulesEngine
-from src.game.models import Character, Phase
+from src.game.cards import EFFECT_CARDS
+from src.game.engine import TOGGLE_BITS, RulesEngine
+from src.game.models import SEASON_IDX, Character, OutcomeType, Phase, Season
 
 
 def _engine() -> RulesEngine:
@@ -18,6 +19,7 @@ def test_vote_token_three_must_be_first() -> None:
     assert not engine.take_token(Character.CARMICHAEL, 1)
     assert engine.take_token(Character.CARMICHAEL, 3)
     assert engine.take_token(Character.QUINCY, 1)
+    assert engine.state.token_mask == (1 << 3) | (1 << 1)
 
 
 def test_negotiation_word_cap_mutes_player() -> None:
@@ -32,6 +34,18 @@ def test_negotiation_word_cap_mutes_player() -> None:
     assert muted_2
 
 
+def test_word_cap_truncation_collapses_whitespace_across_calls() -> None:
+    engine = _engine()
+
+    kept, muted = engine.record_utterance(Character.QUINCY, "one   two", binding_allowed=False)
+    assert (kept, muted) == ("one two", False)
+
+    kept_2, muted_2 = engine.record_utterance(Character.QUINCY, "three\nfour   five six seven", binding_allowed=False)
+    assert kept_2 == "three four five"
+    assert muted_2
+    assert engine.state.word_counts[Character.QUINCY] == 5
+
+
 def test_voting_order_and_vote_changes() -> None:
     engine = _engine()
     engine.take_token(Character.CARMICHAEL, 3)
@@ -75,7 +89,7 @@ def test_newly_received_promise_tokens_are_not_spendable_until_next_round() -> N
 
 def test_shotgun_breaks_tie() -> None:
     engine = _engine()
-    engine.state.active_toggles.add("Shotgun")
+    engine.state.active_toggles |= TOGGLE_BITS["Shotgun"]
     engine.take_token(Character.CARMICHAEL, 3)
     engine.take_token(Character.QUINCY, 1)
     engine.take_token(Character.MEDICI, 2)
@@ -91,6 +105,33 @@ def test_shotgun_breaks_tie() -> None:
     assert result.passed_proposal_index == 1
 
 
+def _vote_all(engine: RulesEngine, votes: tuple[int, int, int, int]) -> None:
+    for token, character in enumerate((Character.CARMICHAEL, Character.QUINCY, Character.MEDICI, Character.DAMBROSIO)):
+        engine.take_token(character, (3, 1, 2, 4)[token])
+    engine.enter_voting_phase()
+    for token, vote in zip((1, 2, 3, 4), votes):
+        assert engine.cast_vote(engine.state.token_assignments[token], vote)
+
+
+def test_tie_without_shotgun_passes_nothing() -> None:
+    engine = _engine()
+    _vote_all(engine, (1, 0, 0, 1))
+
+    result = engine.resolve_round()
+    assert result.passed_proposal_index is None
+    assert result.outcome_type is None
+
+
+def test_unanimous_vote_is_consensus() -> None:
+    engine = _engine()
+    _vote_all(engine, (1, 1, 1, 1))
+
+    result = engine.resolve_round()
+    assert result.passed_proposal_index == 1
+    assert result.outcome_type == OutcomeType.CONSENSUS
+    assert result.winning_votes == 4
+
+
 def test_export_public_state_includes_holdings() -> None:
     engine = _engine()
     state = engine.export_public_state()
@@ -112,3 +153,111 @@ def test_referee_can_force_existing_vote_only() -> None:
     assert engine.force_vote_by_referee(Character.QUINCY, 1)
     assert engine.state.votes[Character.QUINCY] == 1
     assert not engine.force_vote_by_referee(Character.CARMICHAEL, 1)
+
+
+def test_export_public_state_uses_int_token_keys() -> None:
+    engine = _engine()
+    engine.take_token(Character.CARMICHAEL, 3)
+    assert engine.export_public_state()["token_assignments"] == {3: "Carmichael"}
+
+
+def test_score_players_weights_character_interests() -> None:
+    engine = _engine()
+    engine.state.bells[SEASON_IDX[Season.WINTER]] = 3
+    engine.state.bells[SEASON_IDX[Season.SPRING]] = 2
+    engine.state.bells[SEASON_IDX[Season.SUMMER]] = 1
+
+    scores = engine.score_players()
+
+    assert scores[Character.CARMICHAEL] == 2 * 3 + 2 - 1
+    assert scores[Character.QUINCY] == 0 + 3 - 2
+    assert scores[Character.MEDICI] == 2 * 1 + 0 - 3
+    assert scores[Character.DAMBROSIO] == 2 * 2 + 1 - 0
+    assert engine.export_public_state()["bells"] == {"spring": 2, "summer": 1, "autumn": 0, "winter": 3}
+
+
+def test_effect_deck_is_reshuffled_lazily_on_next_draw() -> None:
+    engine = _engine()
+    engine.take_token(Character.CARMICHAEL, 3)
+    engine.take_token(Character.QUINCY, 1)
+    engine.take_token(Character.MEDICI, 2)
+    engine.take_token(Character.DAMBROSIO, 4)
+    engine.enter_voting_phase()
+    for player in (Character.QUINCY, Character.MEDICI, Character.CARMICHAEL, Character.DAMBROSIO):
+        assert engine.cast_vote(player, 0)
+
+    engine.resolve_round()
+    assert engine.state.effect_deck == []
+
+    engine.start_round()
+    assert len(engine.state.effect_deck) == len(EFFECT_CARDS) - 4
+
+
+def test_toggle_effects_flip_bits_and_export_names() -> None:
+    engine = _engine()
+    shotgun = next(card for card in EFFECT_CARDS if card.name == "Shotgun")
+    clairvoyant = next(card for card in EFFECT_CARDS if card.name == "Clairvoyant")
+
+    engine._apply_effect(shotgun)
+    engine._apply_effect(clairvoyant)
+    assert engine.export_public_state()["toggles"] == ["Clairvoyant", "Shotgun"]
+
+    engine._apply_effect(shotgun)
+    assert engine.export_public_state()["toggles"] == ["Clairvoyant"]
+
+
+def test_start_round_resets_per_round_state_in_place() -> None:
+    engine = _engine()
+    state = engine.state
+    votes, word_counts, muted = state.votes, state.word_counts, state.muted_players
+    engine.record_utterance(Character.CARMICHAEL, "one two three four five", binding_allowed=True)
+    engine.take_token(Character.CARMICHAEL, 3)
+    state.votes[Character.CARMICHAEL] = 0
+    state.vote_changes[Character.QUINCY] = 1
+
+    engine.start_round()
+
+    assert state.votes is votes and not votes
+    assert state.word_counts is word_counts and set(word_counts.values()) == {0}
+    assert set(state.vote_changes.values()) == {0}
+    assert state.muted_players is muted and not muted
+    assert state.token_assignments == [None] * 5
+    assert state.token_mask == 0
+
+
+def test_secret_santa_each_giver_passes_one_own_token_to_someone_else() -> None:
+    engine = _engine()
+    engine.state.holdings[Character.MEDICI][Character.MEDICI] = 0
+
+    engine._apply_secret_santa()
+
+    holdings = engine.state.holdings
+    for giver in (Character.CARMICHAEL, Character.QUINCY, Character.DAMBROSIO):
+        assert holdings[giver][giver] == 4
+        assert sum(holdings[other][giver] for other in holdings if other is not giver) == 1
+    assert sum(holdings[other][Character.MEDICI] for other in holdings) == 0
+
+
+def test_holding_totals_track_holdings_through_effects_and_vote_changes() -> None:
+    engine = _engine()
+    _vote_all(engine, (0, 0, 1, 1))
+    state = engine.state
+
+    def assert_in_step() -> None:
+        assert state.holding_totals == {holder: sum(owned.values()) for holder, owned in state.holdings.items()}
+
+    assert engine.force_vote_change_with_three_tokens(Character.CARMICHAEL, Character.QUINCY, 1)
+    assert_in_step()
+    engine._apply_highway_robbery()
+    assert_in_step()
+    engine._apply_secret_santa()
+    assert_in_step()
+    engine._apply_jubilee()
+    assert_in_step()
+
+
+def test_game_models_are_slotted() -> None:
+    engine = _engine()
+    assert not hasattr(engine.state, "__dict__")
+    assert not hasattr(engine.state.current_proposals[0], "__dict__")
+    assert not hasattr(engine.resolve_round(), "__dict__")